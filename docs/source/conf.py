@@ -5,14 +5,20 @@
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 # -- Version setup -----------------------------------------------------------
-# Delegates to buem/__init__.py which handles all fallbacks.
-try:
-    from buem import __version__ as project_version
-except Exception:
-    project_version = '0.1.2'  # last-resort fallback
+# Read from the installed package metadata; importing buem would run its
+# setuptools-scm fallback (git + pyproject.toml parse) on every build.
+from importlib.metadata import PackageNotFoundError, version as _dist_version
+from pathlib import Path
 
 import sphinx_rtd_theme
 
+_repo_root = Path(__file__).resolve().parents[2]
+
+try:
+    project_version = _dist_version("buem")
+except PackageNotFoundError:
+    project_version = '0.1.2'  # last-resort fallback
+
 # -- Project information -----------------------------------------------------
 
 project = 'BuEM'
@@ -31,7 +37,7 @@ version = '.'.join(project_version.split('.')[:2])  # e.g., '0.1' from '0.1.2'
 extensions = [
     "sphinx_rtd_theme",
     "sphinx.ext.autosectionlabel",
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
 ]
@@ -48,6 +54,13 @@ templates_path = ['_templates']
 # This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = []
 
+# sphinx-autoapi parses the sources statically instead of importing them, so
+# building the docs does not execute module-level code (e.g. the weather load
+# in buem.config.cfg_attribute) or require the runtime dependencies.
+autoapi_type = "python"
+autoapi_dirs = [str(_repo_root / "src" / "buem")]
+autoapi_ignore = ["*/softwares/*", "*/test_*.py"]
+
 # Napoleon settings for Google and NumPy style docstrings
 napoleon_google_docstring = True
 napoleon_numpy_docstring = True
@@ -4,10 +4,11 @@ from buem.env import load_env
 from pathlib import Path
 import logging
 import os
-from logging.handlers import RotatingFileHandler
 
 from buem.apis.model_api import bp as model_bp
 from buem.apis.files_api import bp as files_bp
+from buem.apis.json_provider import OrjsonProvider
+from buem.apis.log_handlers import create_logging_handler
 
 # load .env and apply defaults (no-op if already done)
 load_env()
@@ -23,6 +24,8 @@ OPENAPI_DIR = Path(__file__).resolve().parent
 
 def create_app():
     app = Flask(__name__)
+    # orjson encodes the large timeseries responses in C (see json_provider.py)
+    app.json = OrjsonProvider(app)
     app.register_blueprint(model_bp)
     app.register_blueprint(files_bp)  # register files endpoint
 
@@ -38,37 +41,25 @@ def create_app():
     )
     app.register_blueprint(swagger_bp, url_prefix=SWAGGER_URL)
 
-    # centralized logging - rotates to limit disk usage
-    logdir = LOG_FILE.parent
-    if not logdir.exists():
-        logdir.mkdir(parents=True, exist_ok=True)
-    handler = RotatingFileHandler(str(LOG_FILE), maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8')
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
-    handler.setFormatter(formatter)
-    handler.setLevel(logging.DEBUG)
-
-    # set app logger to DEBUG in dev; production can override via env
-    app.logger.setLevel(logging.DEBUG)
-    app.logger.addHandler(handler)
-
-    # configure root logger and Werkzeug (HTTP request) logger to use same handler
+    # centralized logging: a single queue-backed handler on the root logger.
+    # app.logger and werkzeug propagate to root, so attaching the handler to them
+    # as well would write every record twice.
+    handler = create_logging_handler(LOG_FILE)
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
     logging.basicConfig(level=logging.DEBUG)
-    # avoid duplicate handlers if already attached
     if handler not in root_logger.handlers:
         root_logger.addHandler(handler)
 
-    werk_logger = logging.getLogger('werkzeug')
-    werk_logger.setLevel(logging.DEBUG)
-    if handler not in werk_logger.handlers:
-        werk_logger.addHandler(handler)
+    # set app logger to DEBUG in dev; production can override via env
+    app.logger.setLevel(logging.DEBUG)
+    logging.getLogger('werkzeug').setLevel(logging.DEBUG)
 
     @app.route("/api/health", methods=["GET"])
     def health():
         return jsonify({"status": "ok"}), 200
 
-    app.logger.info(f"BUEM API starting, log: {LOG_FILE}")
+    app.logger.info("BUEM API starting, log: %s", LOG_FILE)
     return app
 
 if __name__ == "__main__":
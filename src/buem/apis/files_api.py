@@ -1,25 +1,48 @@
-from flask import Blueprint, send_from_directory, current_app, jsonify
+from flask import Blueprint, send_from_directory, current_app, abort
+from werkzeug.security import safe_join
+import logging
 import os
 
 bp = Blueprint("files_api", __name__, url_prefix="/api/files")
+logger = logging.getLogger(__name__)
 
 # directory to store/download large results (set via env BUEM_RESULTS_DIR or fallback)
 RESULTS_DIR = os.environ.get("BUEM_RESULTS_DIR", r"D:\test\buem\src\buem\results")
 
+# when set (e.g. "/internal/results/"), downloads are handed to the fronting nginx via
+# X-Accel-Redirect so it streams the file with sendfile(2) instead of a Python worker
+X_ACCEL_PREFIX = os.environ.get("BUEM_X_ACCEL_PREFIX")
+
+@bp.record_once
+def _ensure_results_dir(state):
+    """Create the results dir once when the blueprint is registered, not on every download."""
+    try:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+    except OSError:
+        logger.exception("Failed to create results dir %s", RESULTS_DIR)
+
 @bp.route("/<path:filename>", methods=["GET"])
 def download_file(filename):
-    if not os.path.isdir(RESULTS_DIR):
-        try:
-            os.makedirs(RESULTS_DIR, exist_ok=True)
-        except Exception:
-            current_app.logger.exception("Failed to create results dir")
-            return jsonify({"error": "server_error"}), 500
     # For .gz files, explicitly set mimetype to application/gzip so that
     # Flask does NOT add a Content-Encoding: gzip header.  Without this,
     # Python's mimetypes returns ('application/json', 'gzip') for .json.gz
     # which causes Flask to set Content-Encoding: gzip — the browser then
     # transparently decompresses the response, corrupting the download.
     mimetype = "application/gzip" if filename.endswith(".gz") else None
+    if X_ACCEL_PREFIX:
+        return _accel_redirect(filename, mimetype)
+    # without a proxy, send_from_directory hands the open file to wsgi.file_wrapper,
+    # which gunicorn serves with sendfile(2)
     return send_from_directory(
         RESULTS_DIR, filename, as_attachment=True, mimetype=mimetype,
-    )
\ No newline at end of file
+    )
+
+def _accel_redirect(filename, mimetype):
+    """Return a body-less response telling nginx to serve filename from its internal location."""
+    path = safe_join(RESULTS_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    resp = current_app.response_class(mimetype=mimetype or "application/octet-stream")
+    resp.headers["X-Accel-Redirect"] = X_ACCEL_PREFIX.rstrip("/") + "/" + filename
+    resp.headers.set("Content-Disposition", "attachment", filename=os.path.basename(filename))
+    return resp
\ No newline at end of file
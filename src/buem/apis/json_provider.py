@@ -0,0 +1,48 @@
+"""
+orjson-backed JSON provider for the BUEM Flask app.
+
+Flask's default provider encodes responses with the pure-Python ``json``
+encoder, which is slow for the 8760-point timeseries returned by the model
+endpoints. orjson encodes lists, NumPy arrays and datetimes in C.
+"""
+from typing import Any
+
+import numpy as np
+import orjson
+import pandas as pd
+from flask.json.provider import JSONProvider
+
+from buem.config.cfg_building import _iso_strings
+
+# naive datetimes are emitted without an offset, like Timestamp.isoformat()
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively (pandas objects, numpy scalars)."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, pd.DatetimeIndex):
+        # isoformat() strings; .values would drop the tz of an aware index
+        return _iso_strings(obj)
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return obj.to_numpy()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSONProvider that uses orjson for both request parsing and response encoding."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # encode straight to bytes; skips the str round-trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
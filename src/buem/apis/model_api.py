@@ -1,11 +1,19 @@
 from flask import Blueprint, request, jsonify, current_app
-import json
 import time
-import traceback
+import uuid
 import requests
 import logging
 
-from buem.config.cfg_building import CfgBuilding
+import numpy as np
+import orjson
+import pandas as pd
+
+try:  # ISA-L deflate is several times faster than zlib at low levels
+    from isal import igzip as _gzip
+except ImportError:  # pragma: no cover - optional accelerator
+    import gzip as _gzip
+
+from buem.config.cfg_building import CfgBuilding, _iso_strings
 from buem.main import run_model
 from buem.config.validator import validate_cfg
 
@@ -15,25 +23,98 @@ from buem.integration.scripts.geojson_processor import GeoJsonProcessor
 bp = Blueprint("model_api", __name__, url_prefix="/api")
 logger = logging.getLogger(__name__)
 
-def _to_serializable_timeseries(times_index, arr):
+# shared session: keeps the connection to forward_url targets alive between runs
+# instead of opening a new TCP/TLS connection per forwarded result
+_forward_session = requests.Session()
+
+def _forward_result(url, result):
+    """POST the result to url over the pooled session, encoding the body with orjson."""
+    return _forward_session.post(
+        url,
+        data=orjson.dumps(result),
+        headers={"Content-Type": "application/json"},
+        timeout=30,
+    )
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+def _parse_bool_flag(req, payload, name, default=False):
+    """Read a boolean flag from the query string, falling back to the JSON payload."""
+    v = req.args.get(name)
+    if v is None and payload:
+        v = payload.get(name)
+    if v is None:
+        return default
+    return str(v).strip().lower() in _TRUE_VALUES
+
+def _internal_error(exc, msg):
+    """Log exc with its traceback under a fresh error id; the 500 response carries only the message and id."""
+    err_id = uuid.uuid4().hex
+    current_app.logger.exception("%s (err_id=%s)", msg, err_id)
+    return jsonify({"status": "error", "error": str(exc), "err_id": err_id}), 500
+
+# smaller bodies are not worth a compressor call
+_GZIP_MIN_BYTES = 1024
+
+def _gzip_if_accepted(resp):
+    """Gzip resp's body in one call (level 1) when the client accepts gzip and the body is large."""
+    if request.accept_encodings["gzip"] <= 0:
+        return resp
+    body = resp.get_data()
+    if len(body) < _GZIP_MIN_BYTES:
+        return resp
+    resp.set_data(_gzip.compress(body, compresslevel=1))
+    resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+def _iso_index(times_index):
+    """Format a datetime index as Timestamp.isoformat() strings (vectorized for the usual index)."""
+    return _iso_strings(pd.DatetimeIndex(times_index))
+
+def _to_serializable_timeseries(times_index, arr, index=None):
+    # vectorized: strftime and ndarray.tolist() loop in C instead of per-element Python calls;
+    # pass a precomputed `index` (from _iso_index) to share it between heating and cooling
     return {
-        "index": [ts.isoformat() for ts in list(times_index)],
-        "values": [float(x) for x in list(arr)],
+        "index": _iso_index(times_index) if index is None else index,
+        "values": np.asarray(arr, dtype=np.float64).tolist(),
+    }
+
+def _summarize_loads(times, heating, cooling):
+    """Return heating/cooling summary blocks using NumPy reductions (no per-element Python loop)."""
+    h = np.asarray(heating, dtype=np.float64)
+    c = np.asarray(cooling, dtype=np.float64)
+    span = {
+        "start_time": pd.Timestamp(times[0]).isoformat(),
+        "end_time": pd.Timestamp(times[-1]).isoformat(),
+        "n_points": len(times),
+    }
+    return {
+        "heating": {
+            **span,
+            "heating_total_kWh": float(h.sum()) if h.size else 0.0,
+            "heating_peak_kW": float(h.max()) if h.size else 0.0,
+        },
+        "cooling": {
+            **span,
+            # cooling loads are <= 0 (model sign convention), so |c| totals/peaks come from
+            # -sum/-min without an abs() temporary; 0.0 - x avoids emitting -0.0
+            "cooling_total_kWh": 0.0 - float(c.sum()) if c.size else 0.0,
+            "cooling_peak_kW": 0.0 - float(c.min()) if c.size else 0.0,
+        },
     }
 
 @bp.route("/run", methods=["POST"])
 def run_building_model():
     start = time.time()
+    # current_app is a context-local proxy; resolve the logger once per request
+    log = current_app.logger
     try:
         payload = request.get_json(force=True)
-        include_ts = (request.args.get("include_timeseries", None) or
-        (str(payload.get("include_timeseries")).lower() if payload and 
-         "include_timeseries" in payload else "false")
-        )
-        include_ts = str(include_ts).lower() == "true"
-        gp = GeoJsonProcessor(payload, include_timeseries=include_ts, db_fetcher=...)
-
-        cfgb = CfgBuilding(json.dumps(payload))
+        include_ts = _parse_bool_flag(request, payload, "include_timeseries")
+
+        # payload is already parsed (orjson, via the app's JSON provider); hand the dict over directly
+        cfgb = CfgBuilding.from_mapping(payload)
         cfg = cfgb.to_cfg_dict()
 
         # run centralized validator (returns list of issues)
@@ -43,58 +124,43 @@ def run_building_model():
 
         # call centralized runner (allow caller to request MILP)
         use_milp = bool(payload.get("use_milp", False))
-        res = run_model(cfg, plot=False, use_milp=use_milp)
+        res = run_model(cfg, plot=False, use_milp=use_milp, validate=False)
         times = res["times"]
         heating = res["heating"]
         cooling = res["cooling"]
 
         if include_ts:
+            iso_index = _iso_index(times)
             result = {
-                "heating": _to_serializable_timeseries(times, heating),
-                "cooling": _to_serializable_timeseries(times, cooling),
+                "heating": _to_serializable_timeseries(times, heating, iso_index),
+                "cooling": _to_serializable_timeseries(times, cooling, iso_index),
                 "meta": {"n_points": len(times), "elapsed_s": round(res.get("elapsed_s", time.time()-start), 3)},
             }
         else:
-            hvals = [float(x) for x in list(heating)]
-            cvals = [float(x) for x in list(cooling)]
             result = {
-                "heating": {
-                    "start_time": times[0].isoformat(),
-                    "end_time": times[-1].isoformat(),
-                    "n_points": len(times),
-                    "heating_total_kWh": float(sum(hvals)) if hvals else 0.0,
-                    "heating_peak_kW": float(max(hvals)) if hvals else 0.0,
-                },
-                "cooling": {
-                    "start_time": times[0].isoformat(),
-                    "end_time": times[-1].isoformat(),
-                    "n_points": len(times),
-                    "cooling_total_kWh": float(sum(abs(x) for x in cvals)) if cvals else 0.0,
-                    "cooling_peak_kW": float(max(abs(x) for x in cvals)) if cvals else 0.0,
-                },
+                **_summarize_loads(times, heating, cooling),
                 "meta": {"n_points": len(times), "elapsed_s": round(res.get("elapsed_s", time.time()-start), 3)},
             }
 
         forward_url = payload.get("forward_url")
         if forward_url:
             try:
-                r = requests.post(forward_url, json=result, timeout=30)
+                r = _forward_result(forward_url, result)
                 result["forward"] = {"status_code": r.status_code, "response_text": r.text}
             except Exception as ex:
-                current_app.logger.exception("Forwarding failed")
+                log.exception("Forwarding failed")
                 result["forward"] = {"error": str(ex)}
 
-        current_app.logger.info("Model run completed, points=%d elapsed=%.3fs", len(times), result["meta"]["elapsed_s"])
+        log.info("Model run completed, points=%d elapsed=%.3fs", len(times), result["meta"]["elapsed_s"])
         return jsonify({"status": "ok", "result": result}), 200
 
     except ValueError as ve:
         # validation or other expected errors -> return 400
-        current_app.logger.warning("Validation error: %s", str(ve))
+        log.warning("Validation error: %s", str(ve))
         return jsonify({"status": "error", "error": "validation_failed", "message": str(ve)}), 400
 
     except Exception as exc:
-        current_app.logger.exception("API run failed")
-        return jsonify({"status": "error", "error": str(exc), "trace": traceback.format_exc()}), 500
+        return _internal_error(exc, "API run failed")
 
 # add a unified processing route
 @bp.route("/process", methods=["GET", "POST"])
@@ -111,6 +177,7 @@ def process_payload():
       - include_timeseries=true to include full arrays in GeoJSON output (be careful with payload size).
     """
     start = time.time()
+    log = current_app.logger
     payload = request.get_json(force=True, silent=True)
     if payload is None:
         return jsonify({"status": "error", "error": "invalid_json"}), 400
@@ -124,22 +191,22 @@ def process_payload():
 
     if is_geo:
         try:
-            include_ts = bool(request.args.get("include_timeseries", "false").lower() == "true") or bool(payload.get("include_timeseries", False))
+            include_ts = _parse_bool_flag(request, payload, "include_timeseries")
             processor = GeoJsonProcessor(payload, include_timeseries=include_ts)
             out_doc = processor.process()
-            current_app.logger.info("Processed geojson payload features=%d elapsed=%.3fs", len(out_doc.get("features", [])), time.time()-start)
-            return jsonify(out_doc), 200
+            log.info("Processed geojson payload features=%d elapsed=%.3fs", len(out_doc.get("features", [])), time.time()-start)
+            # the FeatureCollection is encoded by a single orjson call (app JSON provider)
+            return _gzip_if_accepted(jsonify(out_doc)), 200
         except ValueError as ve:
-            current_app.logger.warning("GeoJSON processing error: %s", str(ve))
+            log.warning("GeoJSON processing error: %s", str(ve))
             return jsonify({"status": "error", "error": "geojson_processing_failed", "message": str(ve)}), 400
         except Exception as exc:
-            current_app.logger.exception("GeoJSON processing failed")
-            return jsonify({"status": "error", "error": str(exc), "trace": traceback.format_exc()}), 500
+            return _internal_error(exc, "GeoJSON processing failed")
 
     # fallback: treat as single config -> reuse /run behavior
     try:
-        include_ts = bool(request.args.get("include_timeseries", "false").lower() == "true") or bool(payload.get("include_timeseries", False))
-        cfgb = CfgBuilding(json.dumps(payload))
+        include_ts = _parse_bool_flag(request, payload, "include_timeseries")
+        cfgb = CfgBuilding.from_mapping(payload)
         cfg = cfgb.to_cfg_dict()
 
         issues = validate_cfg(cfg)
@@ -147,50 +214,29 @@ def process_payload():
             return jsonify({"status": "error", "error": "validation_failed", "issues": issues}), 400
 
         use_milp = bool(payload.get("use_milp", False))
-        res = run_model(cfg, plot=False, use_milp=use_milp)
+        res = run_model(cfg, plot=False, use_milp=use_milp, validate=False)
         times = res["times"]
         heating = res["heating"]
         cooling = res["cooling"]
 
         if include_ts:
+            iso_index = _iso_index(times)
             result = {
-                "heating": {
-                    "index": [ts.isoformat() for ts in list(times)],
-                    "values": [float(x) for x in list(heating)],
-                },
-                "cooling": {
-                    "index": [ts.isoformat() for ts in list(times)],
-                    "values": [float(x) for x in list(cooling)],
-                },
+                "heating": _to_serializable_timeseries(times, heating, iso_index),
+                "cooling": _to_serializable_timeseries(times, cooling, iso_index),
                 "meta": {"n_points": len(times), "elapsed_s": round(res.get("elapsed_s", time.time()-start), 3)},
             }
         else:
-            hvals = [float(x) for x in list(heating)]
-            cvals = [float(x) for x in list(cooling)]
             result = {
-                "heating": {
-                    "start_time": times[0].isoformat(),
-                    "end_time": times[-1].isoformat(),
-                    "n_points": len(times),
-                    "heating_total_kWh": float(sum(hvals)) if hvals else 0.0,
-                    "heating_peak_kW": float(max(hvals)) if hvals else 0.0,
-                },
-                "cooling": {
-                    "start_time": times[0].isoformat(),
-                    "end_time": times[-1].isoformat(),
-                    "n_points": len(times),
-                    "cooling_total_kWh": float(sum(abs(x) for x in cvals)) if cvals else 0.0,
-                    "cooling_peak_kW": float(max(abs(x) for x in cvals)) if cvals else 0.0,
-                },
+                **_summarize_loads(times, heating, cooling),
                 "meta": {"n_points": len(times), "elapsed_s": round(res.get("elapsed_s", time.time()-start), 3)},
             }
 
-        current_app.logger.info("Processed cfg payload elapsed=%.3fs", time.time()-start)
+        log.info("Processed cfg payload elapsed=%.3fs", time.time()-start)
         return jsonify({"status": "ok", "result": result}), 200
 
     except ValueError as ve:
-        current_app.logger.warning("Validation error: %s", str(ve))
+        log.warning("Validation error: %s", str(ve))
         return jsonify({"status": "error", "error": "validation_failed", "message": str(ve)}), 400
     except Exception as exc:
-        current_app.logger.exception("Processing failed")
-        return jsonify({"status": "error", "error": str(exc), "trace": traceback.format_exc()}), 500
\ No newline at end of file
+        return _internal_error(exc, "Processing failed")
\ No newline at end of file
@@ -196,10 +196,10 @@ def main() -> None:
     if args.command == "run":
         import numpy as np
 
-        from buem.config.cfg_attribute import cfg
+        from buem.config.cfg_attribute import get_default_cfg
         from buem.main import run_model
 
-        res = run_model(cfg, plot=args.plot, use_milp=args.milp, return_models=True)
+        res = run_model(get_default_cfg(), plot=args.plot, use_milp=args.milp, return_models=True)
         print(f"Heating load total:               {res['heating'].sum():.1f} kWh/yr")
         print(f"Cooling load total:               {res['cooling'].sum():.1f} kWh/yr")
         hvac = float(np.sum(res['heating']) + np.sum(np.abs(res['cooling'])))
@@ -32,9 +32,9 @@ class AttrType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AttributeSpec:
-    """Specification for a configuration attribute."""
+    """Specification for a configuration attribute (immutable; specs are shared by every CfgBuilding)."""
     name: str
     category: AttributeCategory
     type: AttrType
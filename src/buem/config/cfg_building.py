@@ -1,12 +1,13 @@
 # ...existing code...
-from typing import Any, Dict, Optional
-import json
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 import copy
 
+import orjson
 import pandas as pd
 import numpy as np
 
-from buem.config.cfg_attribute import cfg as DEFAULT_CFG, ATTRIBUTE_SPECS
+from buem.config.cfg_attribute import get_default_cfg, get_attribute_specs
 from buem.config.attribute_types import AttributeSpec, AttrType, AttributeCategory
 
 
@@ -17,18 +18,130 @@ def _series_to_list(s: Optional[pd.Series]) -> Optional[list]:
     return list(s.values)
 
 
+def _iso_strings(index: pd.Index) -> list:
+    """
+    Return Timestamp.isoformat() strings for an index.
+
+    Whole-second naive and UTC DatetimeIndexes (the weather index) are formatted with
+    numpy in one vectorized call; anything else falls back to per-Timestamp isoformat().
+    """
+    if isinstance(index, pd.DatetimeIndex) and not (index.microsecond.any() or index.nanosecond.any()):
+        if index.tz is None:
+            return np.datetime_as_string(index.values, unit="s").tolist()
+        if str(index.tz) == "UTC":
+            # .values of a tz-aware index are UTC datetime64s
+            return np.char.add(np.datetime_as_string(index.values, unit="s"), "+00:00").tolist()
+    return [ts.isoformat() for ts in index]
+
+
 def _df_to_serializable(df: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
-    """Convert DataFrame to serializable dict with ISO timestamps and column lists."""
+    """Convert DataFrame to a dict of ISO timestamps and column ndarrays (orjson-serializable)."""
     if df is None:
         return None
     return {
-        "index": [ts.isoformat() for ts in list(df.index)],
-        **{col: list(df[col].values) for col in df.columns},
+        "index": _iso_strings(df.index),
+        **{col: df[col].to_numpy() for col in df.columns},
     }
 
+def _is_json_serializable(v: Any) -> bool:
+    """True if v encodes to JSON as-is (plain Python types; checked with orjson)."""
+    try:
+        orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS)
+        return True
+    except TypeError:
+        return False
+
+# Python types that are JSON-native for each declared attribute type; values of a known
+# attribute that match are emitted without the orjson probe (which would walk e.g. the
+# whole 'components' tree)
+_JSON_NATIVE_BY_TYPE = {
+    AttrType.FLOAT: (float, int),
+    AttrType.INT: (int,),
+    AttrType.BOOL: (bool,),
+    AttrType.STR: (str,),
+    AttrType.LIST: (list,),
+    AttrType.OBJECT: (dict,),
+}
+
+def _to_serializable_value(name: str, v: Any) -> Any:
+    """Convert one attribute value to a serializable form, dispatching on its declared AttrType."""
+    if isinstance(v, pd.Series):
+        return _series_to_list(v)
+    if isinstance(v, pd.DataFrame):
+        return _df_to_serializable(v)
+    if isinstance(v, (np.integer, np.floating)):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    spec = get_attribute_specs().get(name)
+    if spec is not None and isinstance(v, _JSON_NATIVE_BY_TYPE.get(spec.type, ())):
+        return v
+    # dynamically added attributes or unexpected types: probe
+    return v if _is_json_serializable(v) else str(v)
+
+def _is_unchanged(cur: Any, v: Any) -> bool:
+    """True if assigning v over cur would be a no-op (same object, or equal scalar of the same type)."""
+    if cur is v:
+        return True
+    # exact type match so that e.g. True does not compare equal to 1
+    return type(cur) is type(v) and isinstance(v, (bool, int, float, str)) and cur == v
+
+def _align_series(s: pd.Series, index: pd.Index) -> pd.Series:
+    """Reindex s onto index, skipping the reindex when it is already on that index."""
+    if s.index is index or s.index.equals(index):
+        return s
+    return s.reindex(index)
+
+def _copy_default(value: Any) -> Any:
+    """
+    Copy a default/input value for a config section.
+
+    pandas objects are copied shallowly (shared buffers; config code only replaces them,
+    never writes into them), immutable scalars are returned as-is, ndarrays become lists
+    (e.g. a Series default that does not fit the weather index, kept in the list form
+    JSON input has) and containers are deep-copied.
+    """
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.copy(deep=False)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return copy.deepcopy(value)
+
+@lru_cache(maxsize=None)
 def _get_spec_keys_by_category(category: AttributeCategory) -> Dict[str, AttributeSpec]:
-    """Return subset of ATTRIBUTE_SPECS for a category."""
-    return {k: v for k, v in ATTRIBUTE_SPECS.items() if v.category == category}
+    """Return subset of ATTRIBUTE_SPECS for a category (built once per category; do not mutate)."""
+    return {k: v for k, v in get_attribute_specs().items() if v.category == category}
+
+
+@lru_cache(maxsize=1)
+def _get_fixed_defaults() -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Return the FIXED-category defaults template and the keys whose defaults are mutable
+    containers (these need a per-instance copy; pandas objects and scalars are shared).
+    """
+    template = {k: spec.default for k, spec in _get_spec_keys_by_category(AttributeCategory.FIXED).items()}
+    mutable_keys = tuple(k for k, v in template.items() if isinstance(v, (dict, list, set)))
+    return template, mutable_keys
+
+
+@lru_cache(maxsize=8)
+def _parse_iso_index(timestamps: Tuple[Any, ...]) -> pd.DatetimeIndex:
+    """
+    Parse a weather index once per distinct timestamp sequence; the features of one
+    GeoJSON payload usually all send the same year. DatetimeIndex is immutable, so the
+    result is shared.
+    """
+    # explicit ISO8601 skips per-call format inference; cache memoizes repeated strings
+    return pd.to_datetime(list(timestamps), format="ISO8601", cache=True)
+
+
+@lru_cache(maxsize=1)
+def _get_passthrough_specs() -> Dict[str, AttributeSpec]:
+    """Return specs outside WEATHER/BOOLEAN/FIXED (e.g. 'components'), in ATTRIBUTE_SPECS order."""
+    handled = (AttributeCategory.WEATHER, AttributeCategory.BOOLEAN, AttributeCategory.FIXED)
+    return {k: v for k, v in get_attribute_specs().items() if v.category not in handled}
 
 
 class WeatherConfig:
@@ -36,17 +149,25 @@ class WeatherConfig:
     Holder for weather timeseries.
 
     Accepts:
-      - None -> uses DEFAULT_CFG['weather']
+      - None -> uses get_default_cfg()['weather']
       - pandas.DataFrame -> used directly (copy made)
       - dict -> expected keys like "T","GHI","DNI","DHI" as lists and optional "index" (ISO strings)
 
+    Dict input is kept as one float64 ndarray per column plus the index; the
+    DataFrame is only assembled (once) when ``df`` is first accessed.
+
     Attributes:
       df: pandas.DataFrame or None
     """
 
     def __init__(self, value: Optional[Any]):
+        self._df: Optional[pd.DataFrame] = None
+        self._cols: Dict[str, np.ndarray] = {}
+        self._index: Optional[pd.DatetimeIndex] = None
+
         if isinstance(value, pd.DataFrame):
-            self.df = value.copy()
+            self._df = value.copy()
+            self._index = self._df.index
             return
 
         if isinstance(value, dict):
@@ -54,52 +175,64 @@ class WeatherConfig:
             cols = {}
             index = None
             if "index" in value:
-                index = pd.to_datetime(value["index"])
+                index = _parse_iso_index(tuple(value["index"]))
             for c in ("T", "GHI", "DNI", "DHI"):
                 if c in value:
                     cols[c] = np.asarray(value[c], dtype=float)
             if cols:
+                n = len(next(iter(cols.values())))
                 if index is None:
                     # try to reuse default index length if available
-                    default_weather = DEFAULT_CFG.get("weather")
-                    if isinstance(default_weather, pd.DataFrame) and len(default_weather) == len(list(cols.values())[0]):
+                    default_weather = get_default_cfg().get("weather")
+                    if isinstance(default_weather, pd.DataFrame) and len(default_weather) == n:
                         index = default_weather.index
                     else:
-                        index = pd.date_range("2025-01-01", periods=len(list(cols.values())[0]), freq="h")
-                self.df = pd.DataFrame(cols, index=index)
+                        index = pd.date_range("2025-01-01", periods=n, freq="h")
+                self._cols = cols
+                self._index = index
                 return
 
-        # fallback to default weather DataFrame (deep copy)
-        default_weather = DEFAULT_CFG.get("weather")
-        self.df = copy.deepcopy(default_weather) if default_weather is not None else None
+        # fallback to default weather DataFrame (shallow copy)
+        default_weather = get_default_cfg().get("weather")
+        self._df = _copy_default(default_weather)
+        self._index = None if self._df is None else self._df.index
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Weather DataFrame (T, GHI, DNI, DHI), assembled from the column arrays on first access."""
+        if self._df is None and self._cols:
+            self._df = pd.DataFrame(self._cols, index=self._index, copy=False)
+        return self._df
 
     @property
     def index(self) -> Optional[pd.DatetimeIndex]:
         """Return datetime index or None."""
-        return None if self.df is None else self.df.index
+        return self._index
 
     @property
     def n_hours(self) -> int:
         """Number of rows in weather timeseries (0 if none)."""
-        return 0 if self.df is None else len(self.df)
+        return 0 if self._index is None else len(self._index)
 
     def to_serializable(self) -> Optional[Dict[str, Any]]:
-        """Return a JSON-serializable representation of the weather timeseries."""
-        return _df_to_serializable(self.df)
+        """Return a serializable representation of the weather timeseries (columns as ndarrays)."""
+        if self._df is None and self._cols:
+            return {"index": _iso_strings(self._index), **self._cols}
+        return _df_to_serializable(self._df)
 
 
 class BooleanConfig:
     """
     Container for boolean flags. Uses ATTRIBUTE_SPECS to discover boolean keys.
 
-    Initializes from provided dict and uses defaults from DEFAULT_CFG for missing boolean flags.
+    Initializes from provided dict and uses defaults from ATTRIBUTE_SPECS for missing boolean flags.
     New boolean keys supplied by the caller are preserved.
     """
 
     def __init__(self, value: Optional[Dict[str, Any]]):
         self._data: Dict[str, bool] = {}
         bool_specs = _get_spec_keys_by_category(AttributeCategory.BOOLEAN)
-        # start from DEFAULT_CFG booleans
+        # start from default booleans
         for k, spec in bool_specs.items():
             self._data[k] = bool(spec.default)
         # override/extend with provided values
@@ -112,37 +245,43 @@ class BooleanConfig:
         """Return a plain dict of booleans."""
         return dict(self._data)
 
-    def update(self, d: Dict[str, Any]):
-        """Shallow update boolean values from a dict."""
+    def update(self, d: Dict[str, Any]) -> bool:
+        """Shallow update boolean values from a dict. Returns True if any value changed."""
+        changed = False
         for k, v in d.items():
             if k in self._data:
-                self._data[k] = bool(v)
+                b = bool(v)
+                if self._data[k] is not b:
+                    self._data[k] = b
+                    changed = True
+        return changed
 
 
 class FixedConfig:
     """
     Container for fixed/numeric parameters. Uses ATTRIBUTE_SPECS to determine types and defaults.
 
-    Initializes from provided dict and fills missing values from DEFAULT_CFG.
-    If DEFAULT_CFG contains pandas.Series for a key and the caller provides a list of
+    Initializes from provided dict and fills missing values from ATTRIBUTE_SPECS defaults.
+    If the default contains pandas.Series for a key and the caller provides a list of
     matching length to the weather index, the list is converted to pandas.Series.
     """
 
     def __init__(self, value: Optional[Dict[str, Any]], weather_index: Optional[pd.DatetimeIndex]):
-        # copy defaults except weather
-        self._data: Dict[str, Any] = {}
         fixed_specs = _get_spec_keys_by_category(AttributeCategory.FIXED)
 
-        # Initialize defaults
-        for k, spec in fixed_specs.items():
-            self._data[k] = copy.deepcopy(spec.default)
+        # Initialize defaults: one dict copy of the shared template, plus private copies of
+        # the (few) mutable container defaults
+        template, mutable_keys = _get_fixed_defaults()
+        self._data: Dict[str, Any] = dict(template)
+        for k in mutable_keys:
+            self._data[k] = copy.deepcopy(template[k])
 
         # apply provided values
         if isinstance(value, dict):
             for k, v in value.items():
                 if k not in fixed_specs:
                     # allow dynamic addition of new attributes (store as-is)
-                    self._data[k] = copy.deepcopy(v)
+                    self._data[k] = _copy_default(v)
                     continue
                 spec = fixed_specs[k]
 
@@ -153,9 +292,9 @@ class FixedConfig:
                         self._data[k] = pd.Series(arr, index=weather_index)
                         continue
                 if isinstance(v, pd.Series) and weather_index is not None:
-                    self._data[k] = v.reindex(weather_index)
+                    self._data[k] = _align_series(v, weather_index)
                     continue
-                self._data[k] = copy.deepcopy(v)
+                self._data[k] = _copy_default(v)
 
     def as_dict(self) -> Dict[str, Any]:
         """Return fixed parameters preserving pandas objects."""
@@ -165,37 +304,37 @@ class FixedConfig:
         """Return JSON-serializable representation: Series->lists, numpy scalars->py scalars."""
         out: Dict[str, Any] = {}
         for k, v in self._data.items():
-            if isinstance(v, pd.Series):
-                out[k] = _series_to_list(v)
-            elif isinstance(v, pd.DataFrame):
-                out[k] = _df_to_serializable(v)
-            elif isinstance(v, (np.integer, np.floating)):
-                out[k] = v.item()
-            else:
-                try:
-                    json.dumps(v)
-                    out[k] = v
-                except Exception:
-                    out[k] = str(v)
+            out[k] = _to_serializable_value(k, v)
         return out
 
-    def update(self, d: Dict[str, Any], weather_index: Optional[pd.DatetimeIndex]):
-        """Update fixed params with same conversion rules as initializer."""
+    def update(self, d: Dict[str, Any], weather_index: Optional[pd.DatetimeIndex]) -> bool:
+        """
+        Update fixed params with same conversion rules as initializer.
+
+        Values identical to the current ones (same object or equal scalar) are skipped.
+        Returns True if any value changed.
+        """
         if not isinstance(d, dict):
-            return
+            return False
+        changed = False
         for k, v in d.items():
             if k in self._data:
-                spec = ATTRIBUTE_SPECS.get(k)
+                if _is_unchanged(self._data[k], v):
+                    continue
+                changed = True
+                spec = get_attribute_specs().get(k)
                 if spec and spec.type == AttrType.SERIES and isinstance(v, (list, tuple, np.ndarray)) and weather_index is not None:
                     arr = np.asarray(v, dtype=float)
                     if len(arr) == len(weather_index):
                         self._data[k] = pd.Series(arr, index=weather_index)
                         continue
                 if isinstance(v, pd.Series) and weather_index is not None:
-                    self._data[k] = v.reindex(weather_index)
+                    self._data[k] = _align_series(v, weather_index)
                     continue
             # dynamic add or overwrite
-            self._data[k] = copy.deepcopy(v)
+            changed = True
+            self._data[k] = _copy_default(v)
+        return changed
 
 
 class CfgBuilding:
@@ -224,19 +363,45 @@ class CfgBuilding:
         elif isinstance(json_input, str):
             if not json_input.strip():
                 raise ValueError("CfgBuilding requires a non-empty JSON string on initialization.")
-            parsed = json.loads(json_input)
+            parsed = orjson.loads(json_input)
         else:
             raise ValueError("CfgBuilding requires a dict or non-empty JSON string on initialization.")
+        self._init_from_dict(parsed)
 
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any]) -> "CfgBuilding":
+        """
+        Build a CfgBuilding from an already-parsed dict (e.g. a decoded request payload).
+
+        Skips the type dispatch of ``__init__``; the dict is never re-serialized to JSON.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("CfgBuilding.from_mapping requires a dict.")
+        obj = cls.__new__(cls)
+        obj._init_from_dict(data)
+        return obj
+
+    def _init_from_dict(self, parsed: Dict[str, Any]):
+        """Populate weather, boolean and fixed sections from a parsed input dict."""
         # ensure all attributes are present (fill missing from specs)
         parsed_filled = self._ensure_and_normalize_input(parsed)
         # keep normalized input available for building the internal cfg (includes 'components')
         self._parsed_filled = parsed_filled
+        # aggregated element area, filled lazily by _component_area()
+        self._a_ref_cache: Optional[float] = None
 
         # Extract categories
         weather_input = parsed_filled.get("weather")
-        booleans_input = {k: parsed_filled[k] for k in parsed_filled if k in _get_spec_keys_by_category(AttributeCategory.BOOLEAN)}
-        fixed_input = {k: parsed_filled[k] for k in parsed_filled if k in _get_spec_keys_by_category(AttributeCategory.FIXED)}
+        bool_specs = _get_spec_keys_by_category(AttributeCategory.BOOLEAN)
+        fixed_specs = _get_spec_keys_by_category(AttributeCategory.FIXED)
+        booleans_input: Dict[str, Any] = {}
+        fixed_input: Dict[str, Any] = {}
+        # single pass over the input; categories are disjoint
+        for k, v in parsed_filled.items():
+            if k in bool_specs:
+                booleans_input[k] = v
+            elif k in fixed_specs:
+                fixed_input[k] = v
 
         # build components (weather first to obtain index)
         self.weather = WeatherConfig(weather_input)
@@ -249,27 +414,28 @@ class CfgBuilding:
     def _ensure_and_normalize_input(self, data: Any) -> Dict[str, Any]:
         """
         Ensure all attributes (from ATTRIBUTE_SPECS) exist in the input dict. Missing attributes
-        are injected from defaults. For pandas objects in defaults, convert them to serializable
-        forms (lists or nested dicts) so JSON input/POST payloads remain plain JSON.
+        are injected from defaults in the form the section builders consume directly:
+        Series defaults as ndarrays (re-indexed positionally onto the weather index by
+        FixedConfig) and no entry for a missing weather DataFrame (WeatherConfig falls back
+        to the default). Nothing is round-tripped through strings or lists.
         """
         if not isinstance(data, dict):
             data = {}
         out = dict(data)  # shallow copy
 
         # fill missing from specs
-        for name, spec in ATTRIBUTE_SPECS.items():
+        for name, spec in get_attribute_specs().items():
             if name in out:
                 continue
-            # supply default in JSON-friendly form
             default = spec.default
             if spec.type == AttrType.DATAFRAME and isinstance(default, pd.DataFrame):
-                # convert to serializable dict of lists
-                out[name] = _df_to_serializable(default)
+                # WeatherConfig(None) shares the default frame; no ISO-string round-trip
+                continue
             elif spec.type == AttrType.SERIES and isinstance(default, pd.Series):
-                out[name] = _series_to_list(default)
+                out[name] = default.to_numpy()
             else:
-                # primitive or list/dict assumed JSON-serializable
-                out[name] = copy.deepcopy(default)
+                # primitives are shared, lists/dicts copied
+                out[name] = _copy_default(default)
         return out
 
     def _build_internal_cfg(self):
@@ -283,31 +449,35 @@ class CfgBuilding:
 
         # include other attributes from ATTRIBUTE_SPECS that are not in WEATHER/BOOLEAN/FIXED
         # (e.g., 'components' and other "OTHER" category attributes)
-        for name, spec in ATTRIBUTE_SPECS.items():
-            if spec.category not in (AttributeCategory.WEATHER, AttributeCategory.BOOLEAN, AttributeCategory.FIXED):
-                # prefer value from the originally-parsed input (self._parsed_filled),
-                # which already contains defaults if the caller omitted them.
-                try:
-                    cfg[name] = copy.deepcopy(self._parsed_filled.get(name))
-                except Exception:
-                    # fallback: use the spec default if anything goes wrong
-                    cfg[name] = copy.deepcopy(spec.default)
+        # Values are referenced here; to_cfg_dict() copies containers on the way out.
+        for name in _get_passthrough_specs():
+            # prefer value from the originally-parsed input (self._parsed_filled),
+            # which already contains defaults if the caller omitted them.
+            cfg[name] = self._parsed_filled.get(name)
 
         # include any dynamically added items present in fixed._data (already added via update),
         # leave _cfg on the instance
         self._cfg = cfg
 
+    def _shallow_copy_cfg(self) -> Dict[str, Any]:
+        """Copy the internal cfg: dict/list values (e.g. 'components') deep, everything else by reference."""
+        return {k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v for k, v in self._cfg.items()}
+
     def to_cfg_dict(self) -> Dict[str, Any]:
         """
         Return configuration dict using the canonical structured representation.
 
-        Returns a deep copy of the internal cfg where:
+        Returns a copy of the internal cfg where:
          - 'weather' is a pandas.DataFrame
          - 'components' is the structured tree (dict)
          - if 'A_ref' is not present but components are present, A_ref is derived
+
+        Nested dicts/lists are deep-copied, but the weather DataFrame and the hourly
+        Series are shared with this instance (and the attribute defaults): replace
+        them rather than modifying them in place.
         """
         self._build_internal_cfg()
-        cfg = copy.deepcopy(self._cfg)
+        cfg = self._shallow_copy_cfg()
 
         # Ensure components is present and compute A_ref if missing
         comps = cfg.get("components")
@@ -318,6 +488,15 @@ class CfgBuilding:
 
         # compute aggregated A_ref if absent
         if "A_ref" not in cfg:
+            total_area = self._component_area(comps)
+            if total_area > 0:
+                cfg["A_ref"] = total_area
+
+        return cfg
+
+    def _component_area(self, comps: Dict[str, Any]) -> float:
+        """Sum of element areas over all components; cached until update_from_dict() runs."""
+        if self._a_ref_cache is None:
             total_area = 0.0
             for comp_data in comps.values():
                 if isinstance(comp_data, dict):
@@ -326,61 +505,60 @@ class CfgBuilding:
                             total_area += float(e.get("area", 0.0))
                         except Exception:
                             pass
-            if total_area > 0:
-                cfg["A_ref"] = total_area
-
-        return cfg
+            self._a_ref_cache = total_area
+        return self._a_ref_cache
 
     def to_json(self) -> str:
         """
         Return a JSON string suitable for API responses.
         Contains all attributes (including dynamically added ones).
 
-        Series/DataFrame are converted to lists/serializable dicts.
+        Series/DataFrame are converted to lists/serializable dicts. Built straight from
+        the section containers (same key order as the internal cfg) rather than from a
+        freshly merged internal cfg.
         """
-        self._build_internal_cfg()
-        out: Dict[str, Any] = {}
-        out["weather"] = _df_to_serializable(self._cfg.get("weather"))
-        for k, v in self._cfg.items():
-            if k == "weather":
-                continue
-            if isinstance(v, pd.Series):
-                out[k] = _series_to_list(v)
-            elif isinstance(v, pd.DataFrame):
-                out[k] = _df_to_serializable(v)
-            elif isinstance(v, (np.integer, np.floating)):
-                out[k] = v.item()
-            else:
-                try:
-                    json.dumps(v)
-                    out[k] = v
-                except Exception:
-                    out[k] = str(v)
-        return json.dumps(out, indent=2)
-
-    def update_from_dict(self, d: Dict[str, Any]):
+        out: Dict[str, Any] = {"weather": self.weather.to_serializable()}
+        out.update(self.booleans.as_dict())  # plain bools, serialized as-is
+        out.update(self.fixed.to_serializable())
+        for name in _get_passthrough_specs():
+            out[name] = _to_serializable_value(name, self._parsed_filled.get(name))
+        return orjson.dumps(
+            out, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+
+    def update_from_dict(self, d: Dict[str, Any]) -> bool:
         """
         Update configuration from a dict. Supports nested {'weather':..., 'booleans':..., 'fixed':...}
         or flat mapping. Missing attributes are left unchanged. Defaults remain available for
         attributes not supplied.
+
+        Returns True if anything changed; an idempotent update (e.g. a client re-posting its
+        full state) leaves the internal cfg untouched.
         """
         if not isinstance(d, dict):
-            return
+            return False
+        changed = False
         if "weather" in d:
             self.weather = WeatherConfig(d.get("weather"))
+            changed = True
         # booleans
-        bool_updates = {k: v for k, v in d.items() if k in _get_spec_keys_by_category(AttributeCategory.BOOLEAN)}
-        if bool_updates:
-            self.booleans.update({k: v for k, v in d.items() if k in _get_spec_keys_by_category(AttributeCategory.BOOLEAN)})
+        bool_specs = _get_spec_keys_by_category(AttributeCategory.BOOLEAN)
+        bool_updates = {k: v for k, v in d.items() if k in bool_specs}
+        if bool_updates and self.booleans.update(bool_updates):
+            changed = True
         # fixed
-        fixed_updates = {k: v for k, v in d.items() if k in _get_spec_keys_by_category(AttributeCategory.FIXED)}
-        if fixed_updates:
-            self.fixed.update(fixed_updates, weather_index=self.weather.index)
-        self._build_internal_cfg()
+        fixed_specs = _get_spec_keys_by_category(AttributeCategory.FIXED)
+        fixed_updates = {k: v for k, v in d.items() if k in fixed_specs}
+        if fixed_updates and self.fixed.update(fixed_updates, weather_index=self.weather.index):
+            changed = True
+        if changed:
+            self._a_ref_cache = None
+            self._build_internal_cfg()
+        return changed
 
     @classmethod
     def from_json_file(cls, path: str) -> "CfgBuilding":
         """Construct CfgBuilding from a JSON file path."""
-        with open(path, "r", encoding="utf-8") as fh:
-            s = fh.read()
-        return cls(s)
+        with open(path, "rb") as fh:
+            parsed = orjson.loads(fh.read())
+        return cls(parsed)
@@ -5,92 +5,183 @@ Function validate_cfg(cfg: dict) -> List[str]:
   - Returns empty list when cfg passes checks.
   - Returns list of human-readable issue strings otherwise.
 Checks performed:
-  - presence of components or legacy U_* keys
+  - presence of the structured 'components' tree (legacy U_* keys are not accepted)
   - numeric positive U values for Walls/Windows/Roof/Floor/Doors
   - element areas > 0 and unique element ids if 'components' provided
   - weather timeseries length consistent when series provided
 """
-from typing import Dict, List, Any, Set
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import numpy as np
+import orjson
+
+_COMPONENTS = ("Walls", "Windows", "Roof", "Floor", "Doors")
+# (component, message prefix) pairs, built once
+_COMPONENT_PREFIXES = tuple((comp, "components." + comp) for comp in _COMPONENTS)
+
+# message tails shared by component- and element-level checks
+_MSG_MISSING = " missing"
+_MSG_NO_U_NO_ELEMENTS = " missing U and no elements present"
+_MSG_U_NOT_POSITIVE = ".U must be positive number"
+_MSG_U_INVALID = ".U invalid: "
+_MSG_U_MISSING = ".U missing"
+_MSG_NOT_OBJECT = " not an object"
+_MSG_ID_MISSING = ".id missing"
+_MSG_AREA_MISSING = ".area missing"
+_MSG_AREA_NOT_POSITIVE = ".area must be > 0"
+_MSG_AREA_INVALID = ".area invalid: "
 
 def _is_number(v) -> bool:
+    t = type(v)
+    if t is float or t is int:  # JSON numbers: no try frame, no float() call
+        return True
     try:
         float(v)
         return True
     except Exception:
         return False
 
-def validate_cfg(cfg: Dict[str, Any]) -> List[str]:
-    issues: List[str] = []
+def _positive(v) -> Optional[bool]:
+    """
+    Return whether float(v) > 0, or None if v is not a number.
 
-    # Require structured 'components' tree
-    comps = cfg.get("components")
-    if not isinstance(comps, dict):
-        issues.append("components missing or not an object (required)")
-        return issues
+    Same outcome as ``float(v) <= 0`` inside a try block (NaN counts as positive,
+    bools and numeric strings are converted), with a fast path for int/float.
+    """
+    t = type(v)
+    if t is float or t is int:
+        return not v <= 0
+    try:
+        return not float(v) <= 0
+    except Exception:
+        return None
+
+# element lists at least this long get their area/U values checked in one numpy pass first
+_BULK_MIN_ELEMENTS = 8
+
+def _all_positive(elems: List[Any], key: str) -> bool:
+    """
+    True if every element carries a numeric ``key`` > 0 (NaN counts as positive, as in
+    _positive). False if any value is not positive, missing or not convertible, or an
+    element is not a dict; the caller then checks element by element.
+    """
+    try:
+        arr = np.fromiter((e[key] for e in elems), dtype=np.float64, count=len(elems))
+    except Exception:
+        return False
+    return not (arr <= 0).any()
+
+def _element_prefix(prefix: str, idx: int) -> str:
+    """Return 'components.<comp>.elements[<idx>]'; only called when an issue is reported."""
+    return prefix + ".elements[" + str(idx) + "]"
+
+def _component_issues(comps: Dict[str, Any]) -> List[str]:
+    """Walk the components tree and return its issues (U values, element ids and areas)."""
+    issues: List[str] = []
+    add = issues.append  # bound once; called per element on failing payloads
 
     seen_ids: Set[str] = set()
-    for comp in ("Walls", "Windows", "Roof", "Floor", "Doors"):
+    for comp, prefix in _COMPONENT_PREFIXES:
         c = comps.get(comp)
         if c is None:
-            issues.append(f"components.{comp} missing")
+            add(prefix + _MSG_MISSING)
             continue
 
         # component-level U or per-element U is required
         u = c.get("U")
-        elems = c.get("elements", [])
+        elems = c.get("elements", ())
         if u is None and not elems:
-            issues.append(f"components.{comp} missing U and no elements present")
+            add(prefix + _MSG_NO_U_NO_ELEMENTS)
             continue
 
         if u is not None:
-            try:
-                if float(u) <= 0:
-                    issues.append(f"components.{comp}.U must be positive number")
-            except Exception:
-                issues.append(f"components.{comp}.U invalid: {u}")
+            ok = _positive(u)
+            if ok is None:
+                add(prefix + _MSG_U_INVALID + str(u))
+            elif not ok:
+                add(prefix + _MSG_U_NOT_POSITIVE)
 
         # validate elements if present
-        if isinstance(elems, list):
+        if elems and isinstance(elems, list):
+            # a passing bulk check makes the per-element area/U checks below no-ops
+            bulk = len(elems) >= _BULK_MIN_ELEMENTS
+            areas_ok = bulk and _all_positive(elems, "area")
+            elem_u_ok = bulk and u is None and _all_positive(elems, "U")
             for idx, e in enumerate(elems):
                 if not isinstance(e, dict):
-                    issues.append(f"components.{comp}.elements[{idx}] not an object")
+                    add(_element_prefix(prefix, idx) + _MSG_NOT_OBJECT)
                     continue
                 eid = e.get("id")
                 if eid is None:
-                    issues.append(f"components.{comp}.elements[{idx}].id missing")
+                    add(_element_prefix(prefix, idx) + _MSG_ID_MISSING)
                 else:
                     if eid in seen_ids:
-                        issues.append(f"duplicate element id '{eid}' in components")
+                        add(f"duplicate element id '{eid}' in components")
                     seen_ids.add(eid)
-                area = e.get("area")
-                if area is None:
-                    issues.append(f"components.{comp}.elements[{idx}].area missing")
-                else:
-                    try:
-                        if float(area) <= 0:
-                            issues.append(f"components.{comp}.elements[{idx}].area must be > 0")
-                    except Exception:
-                        issues.append(f"components.{comp}.elements[{idx}].area invalid: {area}")
-                u_e = e.get("U")
-                if u is None:  # if component-level U missing, require per-element U
+                if not areas_ok:
+                    area = e.get("area")
+                    if area is None:
+                        add(_element_prefix(prefix, idx) + _MSG_AREA_MISSING)
+                    else:
+                        ok = _positive(area)
+                        if ok is None:
+                            add(_element_prefix(prefix, idx) + _MSG_AREA_INVALID + str(area))
+                        elif not ok:
+                            add(_element_prefix(prefix, idx) + _MSG_AREA_NOT_POSITIVE)
+                if u is None and not elem_u_ok:  # if component-level U missing, require per-element U
+                    u_e = e.get("U")
                     if u_e is None:
-                        issues.append(f"components.{comp}.elements[{idx}].U missing")
+                        add(_element_prefix(prefix, idx) + _MSG_U_MISSING)
                     else:
-                        try:
-                            if float(u_e) <= 0:
-                                issues.append(f"components.{comp}.elements[{idx}].U must be positive number")
-                        except Exception:
-                            issues.append(f"components.{comp}.elements[{idx}].U invalid: {u_e}")
+                        ok = _positive(u_e)
+                        if ok is None:
+                            add(_element_prefix(prefix, idx) + _MSG_U_INVALID + str(u_e))
+                        elif not ok:
+                            add(_element_prefix(prefix, idx) + _MSG_U_NOT_POSITIVE)
+
+    return issues
+
+@lru_cache(maxsize=256)
+def _cached_component_issues(canonical: bytes) -> Tuple[str, ...]:
+    """Issues for a components tree given as key-sorted JSON; computed once per distinct tree."""
+    return tuple(_component_issues(orjson.loads(canonical)))
+
+def _check_components(comps: Dict[str, Any]) -> List[str]:
+    """
+    Return the component issues, reusing the result for a components tree already seen
+    (template buildings repeated across a batch).
+
+    The tree is keyed on its key-sorted JSON encoding, which round-trips the values the
+    checks look at. Trees that do not encode (non-string keys, arbitrary objects) or that
+    contain null (None, and also NaN/inf, which orjson writes as null) are walked directly.
+    """
+    try:
+        canonical = orjson.dumps(comps, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return _component_issues(comps)
+    if b"null" in canonical:
+        return _component_issues(comps)
+    return list(_cached_component_issues(canonical))
+
+def validate_cfg(cfg: Dict[str, Any]) -> List[str]:
+    # Require structured 'components' tree
+    comps = cfg.get("components")
+    if not isinstance(comps, dict):
+        return ["components missing or not an object (required)"]
+
+    issues = _check_components(comps)
+    add = issues.append
 
     # weather presence/length sanity check (optional)
     weather = cfg.get("weather")
     if weather is None:
-        issues.append("weather missing")
+        add("weather missing")
     else:
         try:
             n = len(weather)
             if n == 0:
-                issues.append("weather timeseries appears empty")
+                add("weather timeseries appears empty")
         except Exception:
             # if not lengthable, ignore deep check here
             pass
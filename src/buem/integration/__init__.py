@@ -47,80 +47,73 @@ Note:
     json_schema/versions/ directory.
 """
 
-# Always available - core validation modules (no full BUEM infrastructure required)
-from buem.integration.scripts.schema_validator import BuemSchemaValidator
-from buem.integration.scripts.schema_manager import SchemaVersionManager, schema_manager
-from buem.integration.scripts.geojson_validator import (
-    validate_geojson_request,
-    create_validation_report,
-    ValidationLevel,
-    ValidationResult,
-    GeoJsonValidator
-)
-
-# Lazy imports for infrastructure-dependent modules 
-def _get_geojson_processor():
-    """Lazy import for GeoJsonProcessor - requires full BUEM infrastructure."""
+import importlib
+from functools import lru_cache
+from typing import Any, Optional
+
+# Public names resolved on first access (PEP 562), so importing one submodule (e.g.
+# buem.integration.scripts.geojson_processor from the API) does not pull in jsonschema
+# and the schema manager.  name -> (module, attribute)
+_LAZY = {
+    # Core validation (no full BUEM infrastructure required)
+    "BuemSchemaValidator": ("buem.integration.scripts.schema_validator", "BuemSchemaValidator"),
+    "SchemaVersionManager": ("buem.integration.scripts.schema_manager", "SchemaVersionManager"),
+    "schema_manager": ("buem.integration.scripts.schema_manager", "schema_manager"),
+    "validate_geojson_request": ("buem.integration.scripts.geojson_validator", "validate_geojson_request"),
+    "create_validation_report": ("buem.integration.scripts.geojson_validator", "create_validation_report"),
+    "ValidationLevel": ("buem.integration.scripts.geojson_validator", "ValidationLevel"),
+    "ValidationResult": ("buem.integration.scripts.geojson_validator", "ValidationResult"),
+    "GeoJsonValidator": ("buem.integration.scripts.geojson_validator", "GeoJsonValidator"),
+    # Infrastructure-dependent (require the BUEM thermal model)
+    "GeoJsonProcessor": ("buem.integration.scripts.geojson_processor", "GeoJsonProcessor"),
+    "BuemDebugger": ("buem.integration.scripts.debug_utils", "BuemDebugger"),
+    "AttributeBuilder": ("buem.integration.scripts.attribute_builder", "AttributeBuilder"),
+}
+
+_INFRASTRUCTURE = frozenset({"GeoJsonProcessor", "BuemDebugger", "AttributeBuilder"})
+
+
+def __getattr__(name: str) -> Any:
     try:
-        from buem.integration.scripts.geojson_processor import GeoJsonProcessor
-        return GeoJsonProcessor
-    except ImportError:
-        return None
-
-def _get_buem_debugger():
-    """Lazy import for BuemDebugger - requires full BUEM infrastructure.""" 
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
     try:
-        from buem.integration.scripts.debug_utils import BuemDebugger
-        return BuemDebugger
-    except ImportError:
-        return None
+        value = getattr(importlib.import_module(module_name), attr)
+    except ImportError as exc:
+        if name not in _INFRASTRUCTURE:
+            raise
+        raise ImportError(
+            f"{name} requires full BUEM infrastructure to be properly configured.\n"
+            "Please ensure the BUEM thermal model modules are installed and accessible."
+        ) from exc
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+@lru_cache(maxsize=8)
+def _get_request_validator(version: Optional[str], schema_dir_mtime_ns: int):
+    """
+    Return a shared BuemSchemaValidator per schema version.
 
-def _get_attribute_builder():
-    """Lazy import for AttributeBuilder - requires full BUEM infrastructure."""
+    Keyed on the versions directory mtime as well, so adding a version directory during
+    development (which may change the latest version) builds a fresh validator.
+    """
+    from buem.integration.scripts.schema_validator import BuemSchemaValidator
+    return BuemSchemaValidator(version=version)
+
+
+def _schema_dir_mtime_ns() -> int:
+    from buem.integration.scripts.schema_manager import schema_manager
     try:
-        from buem.integration.scripts.attribute_builder import AttributeBuilder
-        return AttributeBuilder
-    except ImportError:
-        return None
-
-# Create lazy loader classes that give clear error messages
-class _LazyGeoJsonProcessor:
-    """Lazy loader for GeoJsonProcessor - loads on first instantiation."""
-    def __new__(cls, *args, **kwargs):
-        GeojsonProcessorClass = _get_geojson_processor()
-        if GeojsonProcessorClass is None:
-            raise ImportError(
-                "GeoJsonProcessor requires full BUEM infrastructure to be properly configured.\n"
-                "Please ensure the BUEM thermal model modules are installed and accessible."
-            )
-        return GeojsonProcessorClass(*args, **kwargs)
-
-class _LazyBuemDebugger:
-    """Lazy loader for BuemDebugger - loads on first instantiation."""
-    def __new__(cls, *args, **kwargs):
-        BuemDebuggerClass = _get_buem_debugger()
-        if BuemDebuggerClass is None:
-            raise ImportError(
-                "BuemDebugger requires full BUEM infrastructure to be properly configured.\n"
-                "Please ensure the BUEM thermal model modules are installed and accessible."
-            )
-        return BuemDebuggerClass(*args, **kwargs)
-
-class _LazyAttributeBuilder:
-    """Lazy loader for AttributeBuilder - loads on first instantiation.""" 
-    def __new__(cls, *args, **kwargs):
-        AttributeBuilderClass = _get_attribute_builder()
-        if AttributeBuilderClass is None:
-            raise ImportError(
-                "AttributeBuilder requires full BUEM infrastructure to be properly configured.\n"
-                "Please ensure the BUEM thermal model modules are installed and accessible."
-            )
-        return AttributeBuilderClass(*args, **kwargs)
-
-# Export the lazy classes with standard names
-GeoJsonProcessor = _LazyGeoJsonProcessor
-BuemDebugger = _LazyBuemDebugger  
-AttributeBuilder = _LazyAttributeBuilder
+        return schema_manager.base_dir.stat().st_mtime_ns
+    except OSError:
+        return 0
+
 
 # Convenience functions 
 def validate_request_file(file_path, version=None, verbose=True):
@@ -157,8 +150,9 @@ def validate_request_file(file_path, version=None, verbose=True):
         business rules. For schema-only validation, use BuemSchemaValidator directly.
     """
     from pathlib import Path
-    
-    validator = BuemSchemaValidator(version=version)
+
+    # schemas are loaded and compiled once per version, not once per file
+    validator = _get_request_validator(version, _schema_dir_mtime_ns())
     result = validator.validate_file(Path(file_path), schema_type="request")
     
     if verbose:
@@ -177,6 +171,7 @@ def get_latest_schema_version():
         current_version = get_latest_schema_version()
         print(f"Using schema version: {current_version}")
     """
+    from buem.integration.scripts.schema_manager import schema_manager
     return schema_manager.get_latest_version()
 
 def list_schema_versions():
@@ -190,6 +185,7 @@ def list_schema_versions():
         versions = list_schema_versions()
         print(f"Available versions: {', '.join(versions)}")
     """
+    from buem.integration.scripts.schema_manager import schema_manager
     return schema_manager.get_available_versions()
 
 # Public API
@@ -199,7 +195,7 @@ __all__ = [
     "SchemaVersionManager",
     "GeoJsonValidator",
     
-    # Infrastructure-dependent classes (lazy loaded)
+    # Infrastructure-dependent classes
     "GeoJsonProcessor",
     "BuemDebugger", 
     "AttributeBuilder",
@@ -2,15 +2,37 @@
 Build complete building attributes by merging payload, database, and defaults.
 Generate electricity profile and align timeseries indices.
 """
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
 import pandas as pd
 
-from buem.config.cfg_attribute import ATTRIBUTE_SPECS
+from buem.config.cfg_attribute import get_attribute_specs
 from buem.config.validator import validate_cfg
 from buem.occupancy.occupancy_profile import OccupancyProfile
 from buem.occupancy.electricity_consumption import ElectricityConsumptionProfile
 
 
+def _generate_electricity_profile(num_persons: int, year: int, seed: Any) -> pd.Series:
+    """Generate the hourly electricity profile (kWh) for one household."""
+    occ = OccupancyProfile(num_persons=num_persons, year=year, seed=seed)
+    elec_gen = ElectricityConsumptionProfile(occ, seed=seed)
+    profile_df = elec_gen.generate()
+
+    if "total_power_kwh" not in profile_df:
+        raise ValueError("ElectricityConsumptionProfile missing 'total_power_kwh' column")
+
+    return profile_df["total_power_kwh"]
+
+
+@lru_cache(maxsize=64)
+def _cached_electricity_profile(num_persons: int, year: int, seed: int) -> pd.Series:
+    """
+    Seeded profiles are deterministic, so buildings of the same archetype (persons, year,
+    seed) share one generated profile. The Series is shared: do not modify it in place.
+    """
+    return _generate_electricity_profile(num_persons, year, seed)
+
+
 class AttributeBuilder:
     """
     Merge building attributes from multiple sources and generate derived profiles.
@@ -76,7 +98,7 @@ class AttributeBuilder:
         # Start with defaults
         self.merged_attrs = {
             spec.name: spec.default 
-            for spec in ATTRIBUTE_SPECS.values()
+            for spec in get_attribute_specs().values()
         }
         
         # Overlay database values (if available)
@@ -97,27 +119,25 @@ class AttributeBuilder:
         if use_provided:
             return  # Keep provided elecLoad
         
+        specs = get_attribute_specs()
+
         # Extract weather to determine year
-        weather_df = self.merged_attrs.get("weather", ATTRIBUTE_SPECS["weather"].default)
+        weather_df = self.merged_attrs.get("weather", specs["weather"].default)
         if isinstance(weather_df, pd.DataFrame) and not weather_df.empty:
             weather_year = int(weather_df.index[0].year)
         else:
-            weather_year = int(ATTRIBUTE_SPECS["year"].default)
+            weather_year = int(specs["year"].default)
         
         # Get generation parameters
-        num_persons = int(self.merged_attrs.get("num_persons", ATTRIBUTE_SPECS["num_persons"].default))
-        seed = self.merged_attrs.get("seed", ATTRIBUTE_SPECS["seed"].default)
+        num_persons = int(self.merged_attrs.get("num_persons", specs["num_persons"].default))
+        seed = self.merged_attrs.get("seed", specs["seed"].default)
         
         try:
-            # Generate profile
-            occ = OccupancyProfile(num_persons=num_persons, year=weather_year, seed=seed)
-            elec_gen = ElectricityConsumptionProfile(occ, seed=seed)
-            profile_df = elec_gen.generate()
-            
-            if "total_power_kwh" not in profile_df:
-                raise ValueError("ElectricityConsumptionProfile missing 'total_power_kwh' column")
-            
-            elec_series = profile_df["total_power_kwh"]
+            # Generate profile (once per archetype when seeded; unseeded profiles are random)
+            if isinstance(seed, int):
+                elec_series = _cached_electricity_profile(num_persons, weather_year, seed)
+            else:
+                elec_series = _generate_electricity_profile(num_persons, weather_year, seed)
             
             # Align index with weather (8760 hourly points)
             if isinstance(weather_df, pd.DataFrame) and not weather_df.empty:
@@ -81,7 +81,7 @@ class BuemDebugger:
             (is_valid, report) validation result and detailed report.
         """
         if self.verbose:
-            logger.info(f"Validating {source}...")
+            logger.info("Validating %s...", source)
         
         try:
             result = validate_geojson_request(payload)
@@ -119,7 +119,7 @@ class BuemDebugger:
             Processing result or None if failed.
         """
         if self.verbose:
-            logger.info(f"Testing processing pipeline for {file_path}")
+            logger.info("Testing processing pipeline for %s", file_path)
         
         try:
             # Load file
@@ -144,16 +144,16 @@ class BuemDebugger:
             successful = len([f for f in features if 'error' not in f.get('properties', {}).get('buem', {})])
             
             if self.verbose:
-                logger.info(f"✅ Processing completed in {total_time:.2f}s")
-                logger.info(f"📊 Results: {successful}/{len(features)} features processed successfully")
+                logger.info("✅ Processing completed in %.2fs", total_time)
+                logger.info("📊 Results: %s/%s features processed successfully", successful, len(features))
                 
                 if 'validation_report' in result:
                     warnings = result['validation_report'].get('warnings', [])
                     errors = result['validation_report'].get('processing_errors', [])
                     if warnings:
-                        logger.warning(f"⚠️ {len(warnings)} validation warnings")
+                        logger.warning("⚠️ %s validation warnings", len(warnings))
                     if errors:
-                        logger.error(f"❌ {len(errors)} processing errors")
+                        logger.error("❌ %s processing errors", len(errors))
             
             return result
             
@@ -344,7 +344,7 @@ def main():
             print(result)
     
     except Exception as e:
-        logger.error(f"Command failed: {e}")
+        logger.error("Command failed: %s", e)
         sys.exit(1)
 
 
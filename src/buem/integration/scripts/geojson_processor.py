@@ -1,17 +1,22 @@
 """
 Process GeoJSON payloads: extract attributes, run thermal model, return results.
 """
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+import multiprocessing
+import os
 import time
 import uuid
-import json
 import gzip
 import logging
 import numpy as np
+import orjson
 import pandas as pd
-from flask import current_app
 
 from buem.integration.scripts.attribute_builder import AttributeBuilder
 from buem.integration.scripts.geojson_validator import (
@@ -19,12 +24,72 @@ from buem.integration.scripts.geojson_validator import (
     create_validation_report,
     ValidationLevel
 )
-from buem.config.cfg_building import CfgBuilding
+from buem.config.cfg_building import CfgBuilding, _iso_strings
 from buem.main import run_model
 from buem.integration.scripts.result_cache import compute_cfg_hash, get_cached_result, store_result
 
 logger = logging.getLogger(__name__)
 
+try:
+    # python-isal: ISA-L accelerated deflate, same file format and open() signature
+    from isal import igzip as _gzip
+except ImportError:
+    _gzip = gzip
+
+
+def _feature_workers_from_env() -> int:
+    """BUEM_FEATURE_WORKERS as a worker count >= 1; invalid values fall back to 1 with a warning."""
+    raw = os.environ.get("BUEM_FEATURE_WORKERS")
+    if raw is None:
+        return 1
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning("Ignoring BUEM_FEATURE_WORKERS=%r (expected an integer >= 1); using 1", raw)
+        return 1
+    return workers
+
+
+def _init_feature_worker(log_queue: Any, level: int) -> None:
+    """Process-pool initializer: send the worker's log records to the parent through log_queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+class _ParentLogHandler(logging.Handler):
+    """Hand records from process-pool workers to the parent's logger of the same name."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record_logger = logging.getLogger(record.name)
+        if record_logger.isEnabledFor(record.levelno):
+            record_logger.handle(record)
+
+
+@contextmanager
+def _feature_process_pool(workers: int) -> Iterator[Executor]:
+    """
+    ProcessPoolExecutor whose workers are spawned, not forked.
+
+    Forking a threaded server process (gunicorn workers run the logging QueueListener
+    thread) copies locks held by other threads and loses the children's log records;
+    spawned workers start clean and forward their records to this process.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    log_queue = ctx.Queue()
+    listener = QueueListener(log_queue, _ParentLogHandler())
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx,
+            initializer=_init_feature_worker, initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+        ) as pool:
+            yield pool
+    finally:
+        listener.stop()
+
 
 class GeoJsonProcessor:
     """
@@ -48,6 +113,24 @@ class GeoJsonProcessor:
         Function(building_id) -> Dict of additional attributes.
     result_save_dir : str or Path, optional
         Directory for saving .gz files (default: env BUEM_RESULTS_DIR).
+    max_workers : int, optional
+        Workers used to process the features of a FeatureCollection concurrently
+        (default: env BUEM_FEATURE_WORKERS, else 1 = sequential).
+    parallel_milp : bool, optional
+        Also use the pool for collections with a MILP feature (default: env
+        BUEM_PARALLEL_MILP == "1", else False = such collections run sequentially).
+        CBC solves in a subprocess (PuLP) or in C code that releases the GIL, so
+        threads overlap the solves; each feature still builds its own solver.
+    executor : {"thread", "process"}, optional
+        Pool type for max_workers > 1 (default: env BUEM_FEATURE_EXECUTOR, else
+        "thread"). Processes also parallelize the GIL-bound model setup, at the cost
+        of starting workers and pickling features; db_fetcher must then be picklable.
+        Workers are spawned (not forked) and forward their log records to this process.
+    timeseries_format : {"json", "npz"}, optional
+        Format of saved timeseries files (default: env BUEM_TIMESERIES_FORMAT, else
+        "json" = gzip-compressed JSON, .json.gz). "npz" writes compressed NumPy
+        arrays (.npz) with the index as int64 UTC epoch nanoseconds (a naive index
+        is taken as UTC), which skips the per-value text encoding.
     """
     
     def __init__(
@@ -56,16 +139,31 @@ class GeoJsonProcessor:
         include_timeseries: bool = False,
         db_fetcher: Optional[Callable[[str], Dict[str, Any]]] = None,
         result_save_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+        parallel_milp: Optional[bool] = None,
+        timeseries_format: Optional[str] = None,
     ):
         self.payload = payload
         self.include_timeseries = include_timeseries
         self.db_fetcher = db_fetcher
+        if max_workers is None:
+            max_workers = _feature_workers_from_env()
+        self.max_workers = max(1, max_workers)
+        self.executor = executor or os.environ.get("BUEM_FEATURE_EXECUTOR", "thread")
+        if self.executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {self.executor!r}")
+        if parallel_milp is None:
+            parallel_milp = os.environ.get("BUEM_PARALLEL_MILP", "0") == "1"
+        self.parallel_milp = parallel_milp
+        self.timeseries_format = timeseries_format or os.environ.get("BUEM_TIMESERIES_FORMAT", "json")
+        if self.timeseries_format not in ("json", "npz"):
+            raise ValueError(f"timeseries_format must be 'json' or 'npz', got {self.timeseries_format!r}")
         
         # Result save directory
         if result_save_dir:
             self.result_save_dir = Path(result_save_dir)
         else:
-            import os
             default_dir = Path(__file__).resolve().parents[1] / "results"
             self.result_save_dir = Path(os.environ.get("BUEM_RESULTS_DIR", str(default_dir)))
     
@@ -83,7 +181,9 @@ class GeoJsonProcessor:
         ValueError
             If payload validation fails with critical errors.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        # one batch timestamp for the envelope and every per-feature error
+        processed_at = datetime.now(timezone.utc).isoformat()
         
         # Step 1: Validate payload structure and format
         validation_result = validate_geojson_request(self.payload)
@@ -92,14 +192,15 @@ class GeoJsonProcessor:
             errors = validation_result.get_errors()
             error_msgs = [issue.message for issue in errors]
             validation_report = create_validation_report(validation_result)
-            logger.error(f"Payload validation failed:\n{validation_report}")
+            logger.error("Payload validation failed:\n%s", validation_report)
             raise ValueError(f"Invalid GeoJSON payload: {'; '.join(error_msgs[:3])}")
         
         # Log validation warnings if any
         warnings = validation_result.get_warnings()
-        if warnings:
-            warning_msgs = [issue.message for issue in warnings]
-            logger.warning(f"Validation warnings: {'; '.join(warning_msgs)}")
+        # payload-level, so identical for every feature: built once, shared by all features
+        warning_msgs = [issue.message for issue in warnings]
+        if warning_msgs:
+            logger.warning("Validation warnings: %s", '; '.join(warning_msgs))
         
         # Use validated data (with any format conversions applied)
         validated_payload = validation_result.validated_data or self.payload
@@ -112,35 +213,39 @@ class GeoJsonProcessor:
         else:
             raise ValueError("Validated payload has unexpected structure")
         
-        # Process each feature
-        out_features = []
-        processing_errors = []
-        
-        for i, feat in enumerate(features):
-            try:
-                processed = self._process_single_feature(feat, validation_result)
-                out_features.append(processed)
-            except Exception as exc:
-                error_msg = f"Feature {feat.get('id', f'index_{i}')} failed: {exc}"
-                logger.exception(error_msg)
-                processing_errors.append(error_msg)
-                
-                # Include error in feature response
-                feat.setdefault("properties", {}).setdefault("buem", {})
-                feat["properties"]["buem"]["error"] = {
-                    "type": "processing_error",
-                    "message": str(exc),
-                    "feature_id": feat.get('id'),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
-                out_features.append(feat)
+        # Process each feature; features are independent, so they may run on a pool of
+        # threads (the LP solve and numpy work release the GIL) or processes.
+        # Output keeps the input order.
+        workers = min(self.max_workers, len(features))
+        if workers > 1 and not self.parallel_milp and any(self._uses_milp(feat) for feat in features):
+            workers = 1
+        if workers > 1:
+            pool_cm: ContextManager[Executor]
+            if self.executor == "process":
+                pool_cm = _feature_process_pool(workers)
+                chunksize = max(1, len(features) // (4 * workers))
+            else:
+                pool_cm = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="buem-feature")
+                chunksize = 1
+            with pool_cm as pool:
+                outcomes = list(pool.map(
+                    self._run_feature, range(len(features)), features, repeat(warning_msgs), repeat(processed_at),
+                    chunksize=chunksize,
+                ))
+        else:
+            outcomes = [
+                self._run_feature(i, feat, warning_msgs, processed_at) for i, feat in enumerate(features)
+            ]
+
+        out_features = [feat for feat, _ in outcomes]
+        processing_errors = [error_msg for _, error_msg in outcomes if error_msg is not None]
         
         # Build response with metadata
         response = {
             "type": "FeatureCollection",
             "features": out_features,
-            "processed_at": datetime.now(timezone.utc).isoformat(),
-            "processing_elapsed_s": round(time.time() - start_time, 3),
+            "processed_at": processed_at,
+            "processing_elapsed_s": round(time.perf_counter() - start_time, 3),
             "metadata": {
                 "total_features": len(features),
                 "successful_features": len(features) - len(processing_errors),
@@ -158,7 +263,45 @@ class GeoJsonProcessor:
         
         return response
     
-    def _process_single_feature(self, feature: Dict[str, Any], validation_result) -> Dict[str, Any]:
+    def __getstate__(self) -> Dict[str, Any]:
+        # process-pool workers get features passed explicitly; do not pickle the
+        # whole payload along with every task
+        state = self.__dict__.copy()
+        state["payload"] = None
+        return state
+
+    @staticmethod
+    def _uses_milp(feature: Dict[str, Any]) -> bool:
+        """True if the feature requests the MILP solver."""
+        buem = (feature.get("properties") or {}).get("buem") or {}
+        return bool(buem.get("use_milp", False))
+
+    def _run_feature(
+        self, i: int, feat: Dict[str, Any], warning_msgs: List[str], processed_at: str
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Process one feature, returning (feature, error message or None).
+
+        A failure is logged and recorded in the feature's properties.buem.error instead
+        of aborting the whole collection; its timestamp is the batch's processed_at.
+        """
+        try:
+            return self._process_single_feature(feat, warning_msgs), None
+        except Exception as exc:
+            error_msg = f"Feature {feat.get('id', f'index_{i}')} failed: {exc}"
+            logger.exception(error_msg)
+
+            # Include error in feature response
+            feat.setdefault("properties", {}).setdefault("buem", {})
+            feat["properties"]["buem"]["error"] = {
+                "type": "processing_error",
+                "message": str(exc),
+                "feature_id": feat.get('id'),
+                "timestamp": processed_at
+            }
+            return feat, error_msg
+
+    def _process_single_feature(self, feature: Dict[str, Any], warning_msgs: List[str]) -> Dict[str, Any]:
         """
         Process single GeoJSON feature: build attributes, run model, add results.
         
@@ -166,21 +309,27 @@ class GeoJsonProcessor:
         ----------
         feature : Dict[str, Any]
             GeoJSON Feature with properties.buem.building_attributes.
-        validation_result : ValidationResult
-            Validation result from input validation.
+        warning_msgs : List[str]
+            Messages of the payload validation warnings (shared between features).
         
         Returns
         -------
         Dict[str, Any]
             Feature with added thermal_load_profile in properties.buem.
         """
-        props = feature.setdefault("properties", {})
-        buem = props.setdefault("buem", {})
+        # plain lookups for the usual case (properties.buem present); setdefault would
+        # allocate a throwaway {} per call
+        props: Optional[Dict[str, Any]] = feature.get("properties")
+        if props is None:
+            props = feature["properties"] = {}
+        buem: Optional[Dict[str, Any]] = props.get("buem")
+        if buem is None:
+            buem = props["buem"] = {}
         building_id = feature.get("id")
         payload_attrs = buem.get("building_attributes", {})
         
         # Log feature processing start
-        logger.info(f"Processing feature {building_id}")
+        logger.info("Processing feature %s", building_id)
         
         # Build complete attributes
         builder = AttributeBuilder(
@@ -191,7 +340,7 @@ class GeoJsonProcessor:
         merged_attrs = builder.build()
         
         # Convert to model config
-        cfg = CfgBuilding(merged_attrs).to_cfg_dict()
+        cfg = CfgBuilding.from_mapping(merged_attrs).to_cfg_dict()
         
         # Run thermal model (single-pass LP solver, CLARABEL)
         # Check result cache first — identical configs produce identical outputs.
@@ -199,18 +348,21 @@ class GeoJsonProcessor:
         cache_key = compute_cfg_hash(cfg)
         cached = get_cached_result(cache_key)
         
-        start = time.time()
+        start = time.perf_counter()
         if cached is not None:
             res = cached
-            elapsed = time.time() - start
-            logger.info(f"Cache hit for feature {building_id} (key={cache_key[:12]}…)")
+            elapsed = time.perf_counter() - start
+            logger.info("Cache hit for feature %s (key=%s…)", building_id, cache_key[:12])
         else:
-            res = run_model(cfg, plot=False, use_milp=use_milp)
-            elapsed = time.time() - start
+            # AttributeBuilder.build() already ran validate_cfg on these attributes
+            res = run_model(cfg, plot=False, use_milp=use_milp, validate=False)
+            elapsed = time.perf_counter() - start
             store_result(cache_key, res)
         
         # Extract results with validation
+        # normalize once: a DatetimeIndex (the model's own output type) or None
         times = res.get("times", [])
+        times_idx = pd.DatetimeIndex(times) if len(times) else None
         heating = self._validate_array(res.get("heating", []), "heating")
         cooling = self._validate_array(res.get("cooling", []), "cooling")
         
@@ -226,7 +378,7 @@ class GeoJsonProcessor:
         
         # Build comprehensive thermal load profile
         profile = self._build_thermal_load_profile(
-            times, heating, cooling, electricity, elapsed, 
+            times_idx, heating, cooling, electricity, elapsed, 
             props.get("start_time"), props.get("end_time"),
             props.get("resolution", "60"), props.get("resolution_unit", "minutes")
         )
@@ -237,21 +389,21 @@ class GeoJsonProcessor:
             "solver_used": "MILP" if use_milp else "LP (CLARABEL)",
             "processing_time_s": round(elapsed, 3),
             "weather_year": int(getattr(cfg.get("weather", pd.DataFrame()).index, "year", [2018])[0]) if hasattr(cfg.get("weather", pd.DataFrame()).index, "year") else 2018,
-            "validation_warnings": [w.message for w in validation_result.get_warnings()]
+            "validation_warnings": warning_msgs
         }
         
         # Save timeseries if requested
-        if self.include_timeseries and len(times):
+        if self.include_timeseries and times_idx is not None:
             try:
-                fname = self._save_timeseries(times, heating, cooling, electricity)
+                fname = self._save_timeseries(times_idx, heating, cooling, electricity)
                 profile["timeseries_file"] = f"/api/files/{fname}"
             except Exception as exc:
-                logger.exception(f"Timeseries save failed for {building_id}: {exc}")
+                logger.exception("Timeseries save failed for %s: %s", building_id, exc)
         
         # Attach results
         buem["thermal_load_profile"] = profile
         
-        logger.info(f"Successfully processed feature {building_id} in {elapsed:.2f}s")
+        logger.info("Successfully processed feature %s in %.2fs", building_id, elapsed)
         
         return feature
     
@@ -272,25 +424,29 @@ class GeoJsonProcessor:
             Validated and sanitized array.
         """
         try:
-            arr = np.asarray(data, dtype=float)
-            
-            # Sanitize NaN/inf
-            arr = np.nan_to_num(arr, nan=0.0, posinf=1e9, neginf=-1e9)
-            
-            # Check for remaining NaN
-            nan_count = np.isnan(arr).sum()
-            if nan_count > 0:
-                logger.warning(f"Array {array_name}: {nan_count}/{arr.size} NaN values replaced with 0")
-                arr = np.nan_to_num(arr, nan=0.0)
-            
+            # contiguous float64: a no-op for the model's own output arrays
+            arr = np.ascontiguousarray(data, dtype=np.float64)
+
+            # Sanitize NaN/inf; the usual all-finite array is returned without a copy.
+            # Screen with one reduction and no mask: any NaN/inf makes the sum non-finite
+            # (an overflowing sum of finite values is caught by the exact check)
+            if not np.isfinite(np.add.reduce(arr, axis=None)):
+                finite = np.isfinite(arr)
+                if not finite.all():
+                    bad_count = int(arr.size - np.count_nonzero(finite))
+                    logger.warning("Array %s: %s/%s NaN/inf values replaced", array_name, bad_count, arr.size)
+                    # in place when arr is our own conversion; copy when it is the caller's buffer
+                    owned = not (isinstance(data, np.ndarray) and np.may_share_memory(arr, data))
+                    arr = np.nan_to_num(arr, copy=not owned, nan=0.0, posinf=1e9, neginf=-1e9)
+
             return arr
             
         except Exception as e:
-            logger.error(f"Failed to validate array {array_name}: {e}")
+            logger.error("Failed to validate array %s: %s", array_name, e)
             return np.array([], dtype=float)
     
     def _build_thermal_load_profile(
-        self, times, heating, cooling, electricity, elapsed, 
+        self, times_idx, heating, cooling, electricity, elapsed, 
         start_time, end_time, resolution, resolution_unit
     ) -> Dict[str, Any]:
         """
@@ -298,8 +454,8 @@ class GeoJsonProcessor:
         
         Parameters
         ----------
-        times : pd.DatetimeIndex or list
-            Timestamps for the simulation.
+        times_idx : pd.DatetimeIndex or None
+            Timestamps for the simulation (None if the model returned none).
         heating, cooling, electricity : np.ndarray
             Load arrays in kW.
         elapsed : float
@@ -315,19 +471,9 @@ class GeoJsonProcessor:
             Thermal load profile matching response schema.
         """
         # Handle time arrays
-        has_times = False
-        if isinstance(times, pd.DatetimeIndex) and not times.empty:
-            has_times = True
-            start_iso = times[0].isoformat()
-            end_iso = times[-1].isoformat()
-        elif times is not None and len(times) > 0:
-            has_times = True
-            if hasattr(times[0], 'isoformat'):
-                start_iso = times[0].isoformat()
-                end_iso = times[-1].isoformat()
-            else:
-                start_iso = str(times[0])
-                end_iso = str(times[-1])
+        if times_idx is not None:
+            start_iso = times_idx[0].isoformat()
+            end_iso = times_idx[-1].isoformat()
         else:
             start_iso = start_time or "2018-01-01T00:00:00Z"
             end_iso = end_time or "2018-12-31T23:00:00Z"
@@ -338,13 +484,17 @@ class GeoJsonProcessor:
             if len(arr) == 0:
                 return {"total_kwh": 0.0, "max_kw": 0.0, "min_kw": 0.0, "mean_kw": 0.0, "median_kw": 0.0, "std_kw": 0.0}
             
+            total = float(np.sum(arr))
+            mean = total / len(arr)  # == np.mean, without a second summation pass
+            # population std from the known mean; dot fuses square and sum
+            dev = arr - mean
             return {
-                "total_kwh": float(np.sum(arr)),
+                "total_kwh": total,
                 "max_kw": float(np.max(arr)),
                 "min_kw": float(np.min(arr)),
-                "mean_kw": float(np.mean(arr)),
+                "mean_kw": mean,
                 "median_kw": float(np.median(arr)),
-                "std_kw": float(np.std(arr))
+                "std_kw": float(np.sqrt(np.dot(dev, dev) / len(arr)))
             }
         
         heating_stats = safe_stats(heating)
@@ -380,9 +530,9 @@ class GeoJsonProcessor:
             profile["summary"]["energy_intensity_kwh_m2"] = energy_intensity
         
         # Include timeseries data if specifically requested in response (not just for saving)
-        if self.include_timeseries and has_times:
+        if self.include_timeseries and times_idx is not None:
             profile["timeseries"] = {
-                "timestamps": [t.isoformat() for t in times] if isinstance(times, pd.DatetimeIndex) else [str(t) for t in times],
+                "timestamps": _iso_strings(times_idx),
                 "heating_kw": heating.tolist(),
                 "cooling_kw": cooling.tolist(),
                 "electricity_kw": electricity.tolist()
@@ -390,9 +540,9 @@ class GeoJsonProcessor:
         
         return profile
     
-    def _save_timeseries(self, times, heating, cooling, electricity) -> str:
+    def _save_timeseries(self, times_idx: pd.DatetimeIndex, heating, cooling, electricity) -> str:
         """
-        Save timeseries as gzip-compressed JSON.
+        Save timeseries as gzip-compressed JSON, or as .npz (see timeseries_format).
         
         Returns
         -------
@@ -400,24 +550,47 @@ class GeoJsonProcessor:
             Filename (e.g., 'buem_ts_abc123.json.gz').
         """
         self.result_save_dir.mkdir(parents=True, exist_ok=True)
+        if self.timeseries_format == "npz":
+            fname = f"buem_ts_{uuid.uuid4().hex}.npz"
+            full_path = self.result_save_dir / fname
+            # int64 UTC epoch nanoseconds whatever the index's unit; naive times are UTC
+            utc_idx = times_idx.tz_localize("UTC") if times_idx.tz is None else times_idx.tz_convert("UTC")
+            # raw float64/int64 buffers are deflated as they are, no text encoding
+            np.savez_compressed(
+                full_path,
+                index=utc_idx.as_unit("ns").asi8,
+                heat=np.asarray(heating, dtype=np.float64),
+                cool=np.asarray(cooling, dtype=np.float64),
+                electricity=np.asarray(electricity, dtype=np.float64),
+            )
+            logger.info("Saved timeseries: %s", full_path)
+            return fname
+
         fname = f"buem_ts_{uuid.uuid4().hex}.json.gz"
         full_path = self.result_save_dir / fname
 
-        # Convert times to list of ISO strings (handles DatetimeIndex or list)
-        if isinstance(times, pd.DatetimeIndex):
-            time_list = [t.isoformat() for t in times]
-        else:
-            time_list = [t.isoformat() for t in times]
+        # ISO strings, vectorized for the usual whole-second naive/UTC index
+        # (same strings as isoformat())
+        time_list = _iso_strings(times_idx)
 
-        payload = {
-            "index": time_list,
-            "heat": [float(x) for x in heating.tolist()],
-            "cool": [float(x) for x in cooling.tolist()],
-            "electricity": [float(x) for x in electricity.tolist()] if len(electricity) else [],
-        }
+        # orjson serializes the float64 buffers directly (no per-element float());
+        # arrays from _validate_array are NaN-free
+        members = (
+            ("index", time_list),
+            ("heat", np.ascontiguousarray(heating, dtype=np.float64)),
+            ("cool", np.ascontiguousarray(cooling, dtype=np.float64)),
+            ("electricity", np.ascontiguousarray(electricity, dtype=np.float64)),
+        )
 
-        with gzip.open(full_path, "wt", encoding="utf-8") as gz:
-            json.dump(payload, gz, indent=None)
+        # The object is streamed member by member, so only one encoded array is held in
+        # memory at a time; level 1 favours throughput over ratio
+        with _gzip.open(full_path, "wb", compresslevel=1) as gz:
+            sep = b"{"
+            for key, value in members:
+                gz.write(sep + orjson.dumps(key) + b":")
+                gz.write(orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+                sep = b","
+            gz.write(b"}")
 
-        logger.info(f"Saved timeseries: {full_path}")
+        logger.info("Saved timeseries: %s", full_path)
         return fname
\ No newline at end of file
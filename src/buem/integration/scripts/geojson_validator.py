@@ -5,13 +5,14 @@ This module provides robust validation and debugging capabilities for incoming
 GeoJSON requests, supporting both legacy and new component structures.
 Uses marshmallow for schema validation with detailed error reporting.
 """
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union, Tuple
-from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 import json
 import jsonschema
-from marshmallow import Schema, fields, ValidationError, validates, validates_schema, post_load
+from marshmallow import Schema, fields, validate, ValidationError, validates, validates_schema, post_load
 from marshmallow_dataclass import dataclass as marsh_dataclass
 import logging
 
@@ -63,7 +64,7 @@ class ValidationLevel(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Single validation issue with context."""
     level: ValidationLevel
@@ -73,32 +74,46 @@ class ValidationIssue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result with detailed reporting."""
     is_valid: bool
     issues: List[ValidationIssue] = field(default_factory=list)
     validated_data: Optional[Dict[str, Any]] = None
+    # issues bucketed by level at insertion, so the getters do not rescan `issues`
+    _by_level: Dict[ValidationLevel, List[ValidationIssue]] = field(
+        init=False, repr=False, compare=False, default_factory=lambda: {level: [] for level in ValidationLevel}
+    )
+    
+    def __post_init__(self):
+        for issue in self.issues:
+            self._by_level[issue.level].append(issue)
     
     def add_issue(self, level: ValidationLevel, message: str, path: str, 
                   value: Any = None, suggestion: Optional[str] = None):
         """Add a validation issue."""
-        self.issues.append(ValidationIssue(level, message, path, value, suggestion))
+        issue = ValidationIssue(level, message, path, value, suggestion)
+        self.issues.append(issue)
+        self._by_level[level].append(issue)
         if level == ValidationLevel.ERROR:
             self.is_valid = False
     
     def get_errors(self) -> List[ValidationIssue]:
         """Get only error-level issues."""
-        return [issue for issue in self.issues if issue.level == ValidationLevel.ERROR]
+        return list(self._by_level[ValidationLevel.ERROR])
     
     def get_warnings(self) -> List[ValidationIssue]:
         """Get warning-level issues."""
-        return [issue for issue in self.issues if issue.level == ValidationLevel.WARNING]
+        return list(self._by_level[ValidationLevel.WARNING])
+    
+    def get_infos(self) -> List[ValidationIssue]:
+        """Get info-level issues."""
+        return list(self._by_level[ValidationLevel.INFO])
     
     def summary(self) -> str:
         """Get a summary of validation results."""
-        errors = len(self.get_errors())
-        warnings = len(self.get_warnings())
+        errors = len(self._by_level[ValidationLevel.ERROR])
+        warnings = len(self._by_level[ValidationLevel.WARNING])
         if errors > 0:
             return f"Validation failed: {errors} errors, {warnings} warnings"
         elif warnings > 0:
@@ -107,15 +122,40 @@ class ValidationResult:
             return "Validation passed successfully"
 
 
+# child_components component_type -> nested components key (others: title-cased)
+_CHILD_COMPONENT_KEYS = {
+    'wall': 'Walls',
+    'roof': 'Roof',
+    'floor': 'Floor',
+    'window': 'Windows',
+    'door': 'Doors',
+}
+
+# component-level U-values [W/(m2K)] used when no child element carries one
+_DEFAULT_COMPONENT_U = {
+    'Walls': 1.6,
+    'Roof': 1.5,
+    'Floor': 1.7,
+    'Windows': 2.5,
+    'Doors': 3.5,
+}
+
+# shared field validators; failures report the violated bound instead of "Invalid value."
+_POSITIVE = validate.Range(min=0, min_inclusive=False)
+_COMPONENT_TYPE_VALUES = frozenset(e.value for e in ComponentType)
+
+
 class ComponentElementSchema(Schema):
     """Schema for individual building component elements (walls, roof, floor, windows, doors)."""
-    id = fields.Str(required=True, validate=lambda x: len(x.strip()) > 0)
-    area = fields.Float(required=True, validate=lambda x: x > 0)
-    azimuth = fields.Float(required=True, validate=lambda x: 0 <= x <= 360)
-    tilt = fields.Float(required=True, validate=lambda x: 0 <= x <= 90)
+    id = fields.Str(required=True)
+    area = fields.Float(required=True, validate=_POSITIVE)
+    azimuth = fields.Float(
+        required=True, validate=validate.Range(min=0, max=360, error="Azimuth must be between 0 and 360 degrees")
+    )
+    tilt = fields.Float(required=True, validate=validate.Range(min=0, max=90))
     # Optional fields for windows/doors
     surface = fields.Str(required=False, allow_none=True)
-    U = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)  # Allow per-element U-values
+    U = fields.Float(validate=_POSITIVE, required=False, allow_none=True)  # Allow per-element U-values
     
     @validates('id')
     def validate_id_format(self, value, **kwargs):
@@ -123,38 +163,29 @@ class ComponentElementSchema(Schema):
         if not value or not value.strip():
             raise ValidationError("Element ID cannot be empty")
         # Add any specific ID format requirements here
-    
-    @validates('azimuth')
-    def validate_azimuth_range(self, value, **kwargs):
-        """Validate azimuth is in valid range."""
-        if not 0 <= value <= 360:
-            raise ValidationError("Azimuth must be between 0 and 360 degrees")
 
 
 class VentilationElementSchema(Schema):
     """Schema for ventilation system elements."""
-    id = fields.Str(required=True, validate=lambda x: len(x.strip()) > 0)
-    air_changes = fields.Float(required=True, validate=lambda x: x >= 0)
+    id = fields.Str(required=True)
+    air_changes = fields.Float(required=True, validate=validate.Range(min=0, error="Air changes must be non-negative"))
     
     @validates('id')
     def validate_id_format(self, value, **kwargs):
         """Validate element ID format."""
         if not value or not value.strip():
             raise ValidationError("Element ID cannot be empty")
-    
-    @validates('air_changes')
-    def validate_air_changes_range(self, value, **kwargs):
-        """Validate air changes is non-negative."""
-        if value < 0:
-            raise ValidationError("Air changes must be non-negative")
 
 
 class ComponentSchema(Schema):
     """Schema for building component (Walls, Roof, etc.)."""
-    U = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)  # Component-level U-value
-    g_gl = fields.Float(validate=lambda x: 0 < x < 1, required=False, allow_none=True)  # For windows
-    b_transmission = fields.Float(validate=lambda x: x > 0, load_default=1.0)
-    elements = fields.Raw(required=True, validate=lambda x: len(x) > 0)
+    U = fields.Float(validate=_POSITIVE, required=False, allow_none=True)  # Component-level U-value
+    g_gl = fields.Float(
+        validate=validate.Range(min=0, max=1, min_inclusive=False, max_inclusive=False),
+        required=False, allow_none=True,
+    )  # For windows
+    b_transmission = fields.Float(validate=_POSITIVE, load_default=1.0)
+    elements = fields.Raw(required=True, validate=validate.Length(min=1))
     
     @validates('elements')
     def validate_elements(self, value, **kwargs):
@@ -213,46 +244,38 @@ class ComponentSchema(Schema):
 class ChildComponentSchema(Schema):
     """Schema for child components (external format)."""
     component_id = fields.Str(required=True)
-    component_type = fields.Str(required=True, validate=lambda x: x.lower() in [e.value for e in ComponentType])
-    area_m2 = fields.Float(required=True, validate=lambda x: x > 0)
-    orientation_deg = fields.Float(required=True, validate=lambda x: 0 <= x <= 360)
-    tilt_deg = fields.Float(required=True, validate=lambda x: 0 <= x <= 90)
-    u_value = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)
+    component_type = fields.Str(required=True, validate=lambda x: x.lower() in _COMPONENT_TYPE_VALUES)
+    area_m2 = fields.Float(required=True, validate=_POSITIVE)
+    orientation_deg = fields.Float(required=True, validate=validate.Range(min=0, max=360))
+    tilt_deg = fields.Float(required=True, validate=validate.Range(min=0, max=90))
+    u_value = fields.Float(validate=_POSITIVE, required=False, allow_none=True)
     surface_reference = fields.Str(required=False, allow_none=True)  # For windows/doors
 
 
 class BuildingAttributesSchema(Schema):
     """Schema for building attributes."""
     # Location
-    latitude = fields.Float(required=True, validate=lambda x: -90 <= x <= 90)
-    longitude = fields.Float(required=True, validate=lambda x: -180 <= x <= 180)
+    latitude = fields.Float(
+        required=True, validate=validate.Range(min=-90, max=90, error="Latitude must be between -90 and 90")
+    )
+    longitude = fields.Float(
+        required=True, validate=validate.Range(min=-180, max=180, error="Longitude must be between -180 and 180")
+    )
     
     # Basic building properties
-    A_ref = fields.Float(validate=lambda x: x > 0, load_default=100.0)
-    h_room = fields.Float(validate=lambda x: x > 0, load_default=2.5)
+    A_ref = fields.Float(validate=_POSITIVE, load_default=100.0)
+    h_room = fields.Float(validate=_POSITIVE, load_default=2.5)
     
     # Optional external format fields
     country = fields.Str(required=False, allow_none=True)
     building_type = fields.Str(required=False, allow_none=True)
     construction_period = fields.Str(required=False, allow_none=True)
-    heated_area_m2 = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)
-    volume_m3 = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)
-    height_m = fields.Float(validate=lambda x: x > 0, required=False, allow_none=True)
+    heated_area_m2 = fields.Float(validate=_POSITIVE, required=False, allow_none=True)
+    volume_m3 = fields.Float(validate=_POSITIVE, required=False, allow_none=True)
+    height_m = fields.Float(validate=_POSITIVE, required=False, allow_none=True)
     
     # Components (nested structure - preferred)
     components = SmartComponentsField(required=False, allow_none=True)
-    
-    @validates('latitude')
-    def validate_latitude(self, value, **kwargs):
-        """Validate latitude range."""
-        if not -90 <= value <= 90:
-            raise ValidationError("Latitude must be between -90 and 90")
-    
-    @validates('longitude')  
-    def validate_longitude(self, value, **kwargs):
-        """Validate longitude range."""
-        if not -180 <= value <= 180:
-            raise ValidationError("Longitude must be between -180 and 180")
 
 
 class BuemSchema(Schema):
@@ -308,13 +331,13 @@ class PropertiesSchema(Schema):
 
 class GeometrySchema(Schema):
     """Schema for GeoJSON geometry."""
-    type = fields.Str(required=True, validate=lambda x: x == "Point")
-    coordinates = fields.List(fields.Float(), required=True, validate=lambda x: len(x) == 2)
+    type = fields.Str(required=True, validate=validate.Equal("Point"))
+    coordinates = fields.List(fields.Float(), required=True, validate=validate.Length(equal=2))
 
 
 class FeatureSchema(Schema):
     """Schema for GeoJSON feature."""
-    type = fields.Str(required=True, validate=lambda x: x == "Feature")
+    type = fields.Str(required=True, validate=validate.Equal("Feature"))
     id = fields.Str(required=True)
     geometry = fields.Nested(GeometrySchema, required=True)
     properties = fields.Nested(PropertiesSchema, required=True)
@@ -322,8 +345,8 @@ class FeatureSchema(Schema):
 
 class GeoJsonRequestSchema(Schema):
     """Main schema for GeoJSON request."""
-    type = fields.Str(required=True, validate=lambda x: x in ["FeatureCollection", "Feature"])
-    features = fields.List(fields.Nested(FeatureSchema), required=True, validate=lambda x: len(x) > 0)
+    type = fields.Str(required=True, validate=validate.OneOf(["FeatureCollection", "Feature"]))
+    features = fields.List(fields.Nested(FeatureSchema), required=True, validate=validate.Length(min=1))
     timeStamp = fields.DateTime(required=False, allow_none=True)
     numberMatched = fields.Int(required=False, allow_none=True)
     numberReturned = fields.Int(required=False, allow_none=True)
@@ -450,18 +473,13 @@ class GeoJsonValidator:
                 )
     
     def _validate_time_consistency(self, features: List[Dict], result: ValidationResult):
-        """Validate time range consistency."""
+        """Validate time range consistency (features as loaded by the schema: times are datetimes)."""
         for i, feature in enumerate(features):
             props = feature.get('properties', {})
             start_time = props.get('start_time')
             end_time = props.get('end_time')
             
             if start_time and end_time:
-                if isinstance(start_time, str):
-                    start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                if isinstance(end_time, str):
-                    end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                
                 if start_time >= end_time:
                     result.add_issue(
                         ValidationLevel.ERROR,
@@ -687,28 +705,15 @@ class GeoJsonValidator:
     
     def _child_to_nested_components(self, child_components: List[Dict]) -> Dict[str, Any]:
         """Convert child_components array to nested components structure."""
-        components = {}
+        elements_by_key: Dict[str, List[Dict]] = defaultdict(list)
+        keys_with_element_u = set()
         
         # Group by component type
         for child in child_components:
             comp_type = child['component_type'].lower()
             
             # Map component types
-            if comp_type == 'wall':
-                comp_key = 'Walls'
-            elif comp_type == 'roof':
-                comp_key = 'Roof'
-            elif comp_type == 'floor':
-                comp_key = 'Floor'
-            elif comp_type == 'window':
-                comp_key = 'Windows'
-            elif comp_type == 'door':
-                comp_key = 'Doors'
-            else:
-                comp_key = comp_type.title()
-            
-            if comp_key not in components:
-                components[comp_key] = {'elements': []}
+            comp_key = _CHILD_COMPONENT_KEYS.get(comp_type) or comp_type.title()
             
             # Convert to element format
             element = {
@@ -720,26 +725,20 @@ class GeoJsonValidator:
             
             if child.get('u_value'):
                 element['U'] = child['u_value']
+                keys_with_element_u.add(comp_key)
             if child.get('surface_reference'):
                 element['surface'] = child['surface_reference']
             
-            components[comp_key]['elements'].append(element)
-        
-        # Set default U-values if not provided per-element
-        default_u_values = {
-            'Walls': 1.6,
-            'Roof': 1.5,
-            'Floor': 1.7,
-            'Windows': 2.5,
-            'Doors': 3.5
-        }
+            elements_by_key[comp_key].append(element)
         
-        for comp_key, comp_data in components.items():
-            elements = comp_data['elements']
-            has_element_u = any(elem.get('U') for elem in elements)
+        components: Dict[str, Dict[str, Any]] = {}
+        for comp_key, elements in elements_by_key.items():
+            comp_data: Dict[str, Any] = {"elements": elements}
+            components[comp_key] = comp_data
             
-            if not has_element_u and comp_key in default_u_values:
-                comp_data['U'] = default_u_values[comp_key]
+            # Set default U-values if not provided per-element
+            if comp_key not in keys_with_element_u and comp_key in _DEFAULT_COMPONENT_U:
+                comp_data['U'] = _DEFAULT_COMPONENT_U[comp_key]
             
             # Add special properties for windows
             if comp_key == 'Windows':
@@ -752,26 +751,26 @@ class GeoJsonValidator:
         self._flatten_errors(errors, result, "")
     
     def _flatten_errors(self, errors: Union[Dict, List, str], result: ValidationResult, path: str):
-        """Recursively flatten nested error messages with actionable suggestions."""
-        if isinstance(errors, dict):
-            for key, value in errors.items():
-                new_path = f"{path}.{key}" if path else key
-                self._flatten_errors(value, result, new_path)
-        elif isinstance(errors, list):
-            for error in errors:
+        """Flatten nested error messages with actionable suggestions (depth-first, in input order)."""
+        # explicit stack instead of one call per nesting level; children are pushed
+        # reversed so issues come out in the order of the error tree
+        stack = [(errors, path)]
+        while stack:
+            node, node_path = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(
+                    (value, f"{node_path}.{key}" if node_path else key)
+                    for key, value in reversed(node.items())
+                )
+                continue
+            for error in node if isinstance(node, list) else (node,):
+                message = str(error)
                 result.add_issue(
                     ValidationLevel.ERROR,
-                    str(error),
-                    path,
-                    suggestion=self._suggest_fix(str(error), path)
+                    message,
+                    node_path,
+                    suggestion=self._suggest_fix(message, node_path)
                 )
-        else:
-            result.add_issue(
-                ValidationLevel.ERROR,
-                str(errors),
-                path,
-                suggestion=self._suggest_fix(str(errors), path)
-            )
 
     @staticmethod
     def _suggest_fix(error_msg: str, path: str) -> str:
@@ -820,8 +819,13 @@ def validate_geojson_request(payload: Dict[str, Any], strict_mode: bool = False)
     ValidationResult
         Validation results with detailed error reporting.
     """
-    validator = GeoJsonValidator(strict_mode=strict_mode)
-    return validator.validate(payload)
+    return _get_validator(strict_mode).validate(payload)
+
+
+@lru_cache(maxsize=2)
+def _get_validator(strict_mode: bool) -> GeoJsonValidator:
+    """Shared validator per strict_mode; the marshmallow schema tree is built once."""
+    return GeoJsonValidator(strict_mode=strict_mode)
 
 
 def create_validation_report(result: ValidationResult) -> str:
@@ -842,23 +846,25 @@ def create_validation_report(result: ValidationResult) -> str:
     report.append(f"Status: {result.summary()}")
     report.append("")
     
-    if result.get_errors():
+    errors = result.get_errors()
+    if errors:
         report.append("ERRORS:")
-        for issue in result.get_errors():
+        for issue in errors:
             report.append(f"  ❌ {issue.path}: {issue.message}")
             if issue.suggestion:
                 report.append(f"     💡 Suggestion: {issue.suggestion}")
         report.append("")
     
-    if result.get_warnings():
+    warnings = result.get_warnings()
+    if warnings:
         report.append("WARNINGS:")
-        for issue in result.get_warnings():
+        for issue in warnings:
             report.append(f"  ⚠️  {issue.path}: {issue.message}")
             if issue.suggestion:
                 report.append(f"     💡 Suggestion: {issue.suggestion}")
         report.append("")
     
-    info_issues = [i for i in result.issues if i.level == ValidationLevel.INFO]
+    info_issues = result.get_infos()
     if info_issues:
         report.append("INFO:")
         for issue in info_issues:
@@ -72,7 +72,7 @@ def get_cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
         with open(path, "rb") as f:
             return pickle.load(f)
     except Exception as exc:
-        logger.debug(f"Cache read error for {cache_key}: {exc}")
+        logger.debug("Cache read error for %s: %s", cache_key, exc)
         return None
 
 
@@ -86,7 +86,7 @@ def store_result(cache_key: str, result: Dict[str, Any]) -> None:
         dest = CACHE_DIR / f"{cache_key}.pkl"
         os.replace(tmp_path, str(dest))
     except Exception as exc:
-        logger.debug(f"Cache write error for {cache_key}: {exc}")
+        logger.debug("Cache write error for %s: %s", cache_key, exc)
         try:
             os.unlink(tmp_path)
         except OSError:
@@ -40,12 +40,14 @@ Usage:
     # Get file paths  
     paths = manager.get_schema_paths("v2")
 """
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import re
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,7 +114,8 @@ class SchemaVersionManager:
         
         self._version_cache: Optional[List[str]] = None
     
-    def _parse_version(self, version_str: str) -> Tuple[int, ...]:
+    @staticmethod
+    def _parse_version(version_str: str) -> Tuple[int, ...]:
         """
         Parse version string into tuple for comparison.
         
@@ -147,24 +150,16 @@ class SchemaVersionManager:
         if self._version_cache is not None and not force_refresh:
             return self._version_cache
         
-        if not self.base_dir.exists():
-            logger.warning(f"Schema directory not found: {self.base_dir}")
+        try:
+            mtime_ns = self.base_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("Schema directory not found: %s", self.base_dir)
             return []
         
-        versions_with_tuples = []
-        for child in self.base_dir.iterdir():
-            if child.is_dir() and child.name.startswith("v"):
-                try:
-                    version_tuple = self._parse_version(child.name)
-                    versions_with_tuples.append((version_tuple, child.name))
-                except ValueError:
-                    logger.warning(f"Skipping invalid version directory: {child.name}")
-                    continue
-        
-        # Sort by version tuple
-        versions_with_tuples.sort(key=lambda x: x[0])
-        
-        self._version_cache = [version[1] for version in versions_with_tuples]
+        # the scan is shared between manager instances; adding or removing a version
+        # directory changes the base directory's mtime and so the cache key
+        scan = _scan_versions.__wrapped__ if force_refresh else _scan_versions
+        self._version_cache = list(scan(str(self.base_dir), mtime_ns))
         return self._version_cache
     
     def get_latest_version(self) -> str:
@@ -245,9 +240,8 @@ class SchemaVersionManager:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         
         try:
-            with schema_path.open(encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return orjson.loads(schema_path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in schema file {schema_path}: {e}") from e
     
     def load_example(self, example_type: str, version: Optional[str] = None) -> Dict[str, Any]:
@@ -271,9 +265,8 @@ class SchemaVersionManager:
             raise FileNotFoundError(f"Example file not found: {example_path}")
         
         try:
-            with example_path.open(encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return orjson.loads(example_path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in example file {example_path}: {e}") from e
     
     def version_exists(self, version: str) -> bool:
@@ -317,5 +310,23 @@ class SchemaVersionManager:
         return info
 
 
+@lru_cache(maxsize=8)
+def _scan_versions(base_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Version directory names in base_dir, sorted oldest to newest (mtime_ns keys the cache)."""
+    versions_with_tuples = []
+    for child in Path(base_dir).iterdir():
+        if child.is_dir() and child.name.startswith("v"):
+            try:
+                version_tuple = SchemaVersionManager._parse_version(child.name)
+                versions_with_tuples.append((version_tuple, child.name))
+            except ValueError:
+                logger.warning("Skipping invalid version directory: %s", child.name)
+                continue
+    
+    # Sort by version tuple
+    versions_with_tuples.sort(key=lambda x: x[0])
+    return tuple(version[1] for version in versions_with_tuples)
+
+
 # Convenience instance for the integration module
 schema_manager = SchemaVersionManager()
\ No newline at end of file
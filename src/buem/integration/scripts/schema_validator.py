@@ -28,12 +28,13 @@ Usage:
     validator.print_validation_result(result, verbose=True)
 """
 import argparse
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 import logging
 
+import orjson
 from jsonschema import Draft202012Validator, ValidationError
 
 from buem.integration.scripts.schema_manager import SchemaVersionManager
@@ -89,6 +90,8 @@ class BuemSchemaValidator:
         self.version = version or self.schema_manager.get_latest_version()
         self._request_schema: Optional[Dict[str, Any]] = None
         self._response_schema: Optional[Dict[str, Any]] = None
+        # schema_type -> checked and compiled Draft 2020-12 validator
+        self._compiled: Dict[str, Draft202012Validator] = {}
     
     @property
     def request_schema(self) -> Dict[str, Any]:
@@ -104,6 +107,22 @@ class BuemSchemaValidator:
             self._response_schema = self.schema_manager.load_schema("response", self.version)
         return self._response_schema
     
+    def _compiled_validator(self, schema_type: str) -> Draft202012Validator:
+        """Return the validator for schema_type; the schema is checked and compiled once per instance."""
+        validator = self._compiled.get(schema_type)
+        if validator is None:
+            if schema_type == "request":
+                schema = self.request_schema
+            elif schema_type == "response":
+                schema = self.response_schema
+            else:
+                raise ValueError(f"Invalid schema_type: {schema_type}")
+
+            # Validate schema itself first
+            Draft202012Validator.check_schema(schema)
+            validator = self._compiled[schema_type] = Draft202012Validator(schema)
+        return validator
+
     def validate_json_schema(self, 
                            payload: Dict[str, Any], 
                            schema_type: str = "request") -> Tuple[bool, str, List[str]]:
@@ -118,18 +137,9 @@ class BuemSchemaValidator:
             Tuple of (is_valid, summary_message, error_list)
         """
         try:
-            if schema_type == "request":
-                schema = self.request_schema
-            elif schema_type == "response":
-                schema = self.response_schema
-            else:
-                raise ValueError(f"Invalid schema_type: {schema_type}")
-            
-            # Validate schema itself first
-            Draft202012Validator.check_schema(schema)
-            
+            validator = self._compiled_validator(schema_type)
+
             # Validate payload
-            validator = Draft202012Validator(schema)
             errors = list(validator.iter_errors(payload))
             
             if not errors:
@@ -239,8 +249,7 @@ class BuemSchemaValidator:
             Validation result dictionary
         """
         try:
-            with file_path.open(encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = orjson.loads(file_path.read_bytes())
         except Exception as e:
             return {
                 "version": self.version,
@@ -298,6 +307,14 @@ class BuemSchemaValidator:
             print("   (Use --verbose for detailed error information)")
 
 
+@lru_cache(maxsize=8)
+def _checked_schema_validator(schema_path: str, mtime_ns: int) -> Draft202012Validator:
+    """Load schema_path, check it against the metaschema and compile it (once per file version)."""
+    schema = cast(Any, orjson.loads(Path(schema_path).read_bytes()))
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
 def _validate_payload_legacy(*, 
                            label: str, 
                            schema_path: Path, 
@@ -309,11 +326,11 @@ def _validate_payload_legacy(*,
     This maintains the same interface as the colleague's original validator.
     """
     try:
-        schema = cast(Any, json.loads(schema_path.read_text(encoding="utf-8")))
+        validator = _checked_schema_validator(str(schema_path), schema_path.stat().st_mtime_ns)
     except FileNotFoundError:
         print(f"❌ Schema file not found: {schema_path}")
         return 2
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Invalid JSON in schema {schema_path}: {e}")
         return 2
     
@@ -322,12 +339,12 @@ def _validate_payload_legacy(*,
         src = "provided payload"
     elif instance_path is not None:
         try:
-            instance = json.loads(instance_path.read_text(encoding="utf-8"))
+            instance = orjson.loads(instance_path.read_bytes())
             src = str(instance_path)
         except FileNotFoundError:
             print(f"❌ Instance file not found: {instance_path}")
             return 2
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"❌ Invalid JSON in {instance_path}: {e}")
             return 2
     else:
@@ -335,8 +352,7 @@ def _validate_payload_legacy(*,
         return 2
     
     try:
-        Draft202012Validator.check_schema(schema)
-        Draft202012Validator(schema).validate(instance)
+        validator.validate(instance)
         print(f"✅ VALID {label}: {src} matches {schema_path}")
         return 0
     except (ValidationError, ValueError) as e:
@@ -2,7 +2,7 @@ import time
 import logging
 from buem.thermal.model_buem import ModelBUEM
 from buem.results.standard_plots import PlotVariables as pvar
-from buem.config.cfg_attribute import cfg
+from buem.config.cfg_attribute import get_default_cfg
 from buem.config.validator import validate_cfg
 import numpy as np
 import sys
@@ -10,7 +10,8 @@ import sys
 logger = logging.getLogger(__name__)
 
 
-def run_model(cfg_dict, plot: bool = False, use_milp: bool = False, return_models: bool = False):
+def run_model(cfg_dict, plot: bool = False, use_milp: bool = False, return_models: bool = False,
+              validate: bool = True):
     """
     Run the ISO 52016 single-pass dead-band thermal model and return results.
 
@@ -30,15 +31,19 @@ def run_model(cfg_dict, plot: bool = False, use_milp: bool = False, return_model
         If True use the experimental MILP solver path.
     return_models : bool, optional
         If True include the ModelBUEM instance in the returned dict under key 'model'.
+    validate : bool, optional
+        If False skip the up-front validate_cfg() pass; for callers that have
+        already validated cfg_dict (ModelBUEM.sim_model still checks it).
     """
     start_time = time.time()
 
     if cfg_dict is None:
         raise ValueError("cfg_dict must be provided to run_model")
 
-    issues = validate_cfg(cfg_dict)
-    if issues:
-        raise ValueError("Configuration validation failed: " + "; ".join(issues))
+    if validate:
+        issues = validate_cfg(cfg_dict)
+        if issues:
+            raise ValueError("Configuration validation failed: " + "; ".join(issues))
 
     try:
         model = ModelBUEM(cfg_dict)
@@ -68,7 +73,7 @@ def run_model(cfg_dict, plot: bool = False, use_milp: bool = False, return_model
 
 def main():
     try:
-        res = run_model(cfg, plot=True, use_milp=False, return_models=True)
+        res = run_model(get_default_cfg(), plot=True, use_milp=False, return_models=True)
     except ValueError as ve:
         print("Configuration validation error:", ve)
         sys.exit(2)
@@ -30,6 +30,7 @@ Requirements:
 """
 
 import json
+import orjson
 import time
 import logging
 import traceback
@@ -53,7 +54,7 @@ def _worker_init():
     BUEM config stack) moves that one-time cost into pool creation rather than into the
     first ``process_single_building`` call.
 
-    The import of ``buem.config.cfg_attribute`` also triggers the weather-data load.
+    Building the attribute defaults also triggers the weather-data load.
     Because the main process has already created the feather cache, the workers read
     the fast binary feather file (~50 ms) instead of parsing the CSV and running the
     pvlib DISC decomposition (~2-3 s).
@@ -64,7 +65,8 @@ def _worker_init():
     import cvxpy          # noqa: F401
 
     # BUEM config stack (triggers weather feather-cache read via cfg_attribute)
-    from buem.config import cfg_attribute        # noqa: F401
+    from buem.config import cfg_attribute
+    cfg_attribute.get_attribute_specs()
 
 # Configure logging
 logging.basicConfig(
@@ -121,7 +123,7 @@ def process_single_building(building_file: Union[str, Path]) -> Dict[str, Any]:
         else:
             building_id = building_file.stem
         
-        logger.info(f"Processing building: {building_id}")
+        logger.info("Processing building: %s", building_id)
         
         # Validate the building configuration
         validation_result = validate_request_file(building_file)
@@ -205,7 +207,8 @@ def process_single_building(building_file: Union[str, Path]) -> Dict[str, Any]:
     except Exception as e:
         processing_time = time.time() - start_time
         error_msg = f"Error processing {building_file}: {str(e)}"
-        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        tb = traceback.format_exc()  # formatted once, used for the log and the result
+        logger.error("%s\n%s", error_msg, tb)
         
         return {
             'building_id': building_file.stem,
@@ -216,7 +219,7 @@ def process_single_building(building_file: Union[str, Path]) -> Dict[str, Any]:
             'metadata': {
                 'processed_at': datetime.now(timezone.utc).isoformat(),
                 'validation_passed': False,
-                'traceback': traceback.format_exc()
+                'traceback': tb
             }
         }
 
@@ -270,12 +273,12 @@ class ParallelBuildingProcessor:
         self.timeout = timeout
         self.progress_callback = progress_callback
         
-        logger.info(f"Initialized ParallelBuildingProcessor with {self.workers} workers")
-        logger.info(f"Optimized for {cpu_count()}-core system")
+        logger.info("Initialized ParallelBuildingProcessor with %s workers", self.workers)
+        logger.info("Optimized for %s-core system", cpu_count())
         
         if PSUTIL_AVAILABLE:
             memory_info = psutil.virtual_memory()
-            logger.info(f"System memory: {memory_info.total / (1024**3):.1f} GB available")
+            logger.info("System memory: %.1f GB available", memory_info.total / (1024**3))
     
     def process_buildings(
         self, 
@@ -307,8 +310,8 @@ class ParallelBuildingProcessor:
         start_time = time.time()
         total_buildings = len(building_files)
         
-        logger.info(f"Starting parallel processing of {total_buildings} buildings")
-        logger.info(f"Using {self.workers} worker processes")
+        logger.info("Starting parallel processing of %s buildings", total_buildings)
+        logger.info("Using %s worker processes", self.workers)
         
         # Initialize results tracking
         completed_buildings = []
@@ -326,9 +329,10 @@ class ParallelBuildingProcessor:
         
         try:
             # Ensure the feather weather cache exists before spawning workers.
-            # The import triggers cfg_attribute module-level code which either reads
-            # the existing cache or creates it from CSV + pvlib DISC.
-            from buem.config import cfg_attribute  # noqa: F401
+            # Loading the defaults either reads the existing cache or creates it
+            # from CSV + pvlib DISC.
+            from buem.config import cfg_attribute
+            cfg_attribute.load_weather()
             logger.info("Weather feather cache ready — workers will load from cache")
 
             # Use ProcessPoolExecutor for better control over process lifecycle.
@@ -353,11 +357,10 @@ class ParallelBuildingProcessor:
                         
                         if result['success']:
                             completed_buildings.append(result)
-                            logger.info(f"✅ Completed: {result['building_id']} "
-                                      f"({result['processing_time']:.2f}s)")
+                            logger.info("✅ Completed: %s (%.2fs)", result['building_id'], result['processing_time'])
                         else:
                             failed_buildings.append(result)
-                            logger.error(f"❌ Failed: {result['building_id']} - {result['error']}")
+                            logger.error("❌ Failed: %s - %s", result['building_id'], result['error'])
                         
                         completed_count += 1
                         
@@ -368,7 +371,7 @@ class ParallelBuildingProcessor:
                         # Memory monitoring
                         if PSUTIL_AVAILABLE and completed_count % 10 == 0:
                             current_memory = process.memory_info().rss / (1024 * 1024)  # MB
-                            logger.info(f"Memory usage: {current_memory:.1f} MB")
+                            logger.info("Memory usage: %.1f MB", current_memory)
                         
                     except TimeoutError:
                         building_file = future_to_file[future]
@@ -380,7 +383,7 @@ class ParallelBuildingProcessor:
                             'file_path': str(building_file)
                         }
                         failed_buildings.append(error_result)
-                        logger.error(f"⏱️ Timeout: {error_result['building_id']}")
+                        logger.error("⏱️ Timeout: %s", error_result['building_id'])
                         completed_count += 1
                     
                     except Exception as e:
@@ -393,11 +396,11 @@ class ParallelBuildingProcessor:
                             'file_path': str(building_file)
                         }
                         failed_buildings.append(error_result)
-                        logger.error(f"💥 Error: {error_result['building_id']} - {str(e)}")
+                        logger.error("💥 Error: %s - %s", error_result['building_id'], str(e))
                         completed_count += 1
         
         except Exception as e:
-            logger.error(f"Critical error in parallel processing: {str(e)}")
+            logger.error("Critical error in parallel processing: %s", str(e))
             raise
         
         # Calculate performance metrics
@@ -442,19 +445,23 @@ class ParallelBuildingProcessor:
                 results_dir = Path(__file__).resolve().parent.parent / "results"
                 results_dir.mkdir(parents=True, exist_ok=True)
                 results_file = str(results_dir / f"parallel_processing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            with open(results_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-            logger.info(f"Results saved to: {results_file}")
+            # orjson encodes numpy values natively; str() stays the fallback for other types
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    results, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+            logger.info("Results saved to: %s", results_file)
             results['results_file'] = results_file
         
         # Log summary
-        logger.info(f"🎯 Processing Summary:")
-        logger.info(f"   Total buildings: {total_buildings}")
-        logger.info(f"   ✅ Successful: {successful_count}")
-        logger.info(f"   ❌ Failed: {failed_count}")
-        logger.info(f"   📊 Success rate: {performance_metrics['success_rate']:.1%}")
-        logger.info(f"   ⏱️ Total time: {total_time:.2f}s")
-        logger.info(f"   🚀 Rate: {performance_metrics['buildings_per_second']:.2f} buildings/sec")
+        logger.info("🎯 Processing Summary:")
+        logger.info("   Total buildings: %s", total_buildings)
+        logger.info("   ✅ Successful: %s", successful_count)
+        logger.info("   ❌ Failed: %s", failed_count)
+        logger.info("   📊 Success rate: %.1f%%", performance_metrics['success_rate'] * 100)
+        logger.info("   ⏱️ Total time: %.2fs", total_time)
+        logger.info("   🚀 Rate: %.2f buildings/sec", performance_metrics['buildings_per_second'])
         
         return results
 
@@ -471,15 +478,15 @@ def demo_parallel_processing():
     building_files = list(dummy_dir.glob("*.json"))
     
     if not building_files:
-        logger.error(f"No building files found in {dummy_dir}")
+        logger.error("No building files found in %s", dummy_dir)
         return
     
-    logger.info(f"Found {len(building_files)} building files for processing")
+    logger.info("Found %s building files for processing", len(building_files))
     
     def progress_handler(completed: int, total: int):
         """Simple progress handler for demonstration."""
         progress = (completed / total) * 100
-        logger.info(f"Progress: {completed}/{total} ({progress:.1f}%)")
+        logger.info("Progress: %s/%s (%.1f%%)", completed, total, progress)
     
     # Create processor with auto-detected worker count
     processor = ParallelBuildingProcessor(
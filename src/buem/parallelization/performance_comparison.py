@@ -124,11 +124,11 @@ class PerformanceComparator:
         # System information
         self.system_info = self._collect_system_info()
         
-        logger.info(f"Initialized PerformanceComparator")
-        logger.info(f"Test scenarios: {self.test_scenarios}")
-        logger.info(f"Max workers: {self.max_workers}")
-        logger.info(f"CPU cores: {psutil.cpu_count()} (logical: {psutil.cpu_count(logical=True)})")
-        logger.info(f"Available memory: {psutil.virtual_memory().total / (1024**3):.1f} GB")
+        logger.info("Initialized PerformanceComparator")
+        logger.info("Test scenarios: %s", self.test_scenarios)
+        logger.info("Max workers: %s", self.max_workers)
+        logger.info("CPU cores: %s (logical: %s)", psutil.cpu_count(), psutil.cpu_count(logical=True))
+        logger.info("Available memory: %.1f GB", psutil.virtual_memory().total / (1024**3))
     
     def _collect_system_info(self) -> Dict[str, Any]:
         """Collect system information for benchmarking context."""
@@ -144,7 +144,7 @@ class PerformanceComparator:
             }
             return sys_info
         except Exception as e:
-            logger.warning(f"Could not collect system info: {e}")
+            logger.warning("Could not collect system info: %s", e)
             return {'error': str(e)}
     
     def compare_processing_methods(
@@ -173,8 +173,8 @@ class PerformanceComparator:
         worker_counts = worker_counts or [1, 2, 4, self.max_workers]
         worker_counts = [w for w in worker_counts if w <= self.max_workers]
         
-        logger.info(f"Starting performance comparison with {len(building_files)} buildings")
-        logger.info(f"Testing worker counts: {worker_counts}")
+        logger.info("Starting performance comparison with %s buildings", len(building_files))
+        logger.info("Testing worker counts: %s", worker_counts)
         
         comparison_results = {
             'test_info': {
@@ -213,8 +213,8 @@ class PerformanceComparator:
         parallel_results = {}
         
         for worker_count in worker_counts:
-            logger.info(f"\\n" + "="*50)
-            logger.info(f"RUNNING PARALLEL PROCESSING ({worker_count} WORKERS)")
+            logger.info("\\n" + "="*50)
+            logger.info("RUNNING PARALLEL PROCESSING (%s WORKERS)", worker_count)
             logger.info("="*50)
             
             parallel_processor = ParallelBuildingProcessor(
@@ -310,7 +310,7 @@ class PerformanceComparator:
         
         for scenario in self.test_scenarios:
             if scenario not in scenario_configs:
-                logger.warning(f"Unknown scenario: {scenario}")
+                logger.warning("Unknown scenario: %s", scenario)
                 continue
             
             config = scenario_configs[scenario]
@@ -322,8 +322,8 @@ class PerformanceComparator:
             else:
                 test_files = building_files[:config['count']]
             
-            logger.info(f"\\n" + "-"*40)
-            logger.info(f"TESTING SCENARIO: {scenario.upper()} ({len(test_files)} buildings)")
+            logger.info("\\n" + "-"*40)
+            logger.info("TESTING SCENARIO: %s (%s buildings)", scenario.upper(), len(test_files))
             logger.info("-"*40)
             
             # Filter worker counts based on availability
@@ -481,7 +481,7 @@ class PerformanceComparator:
         with open(report_file, 'w') as f:
             json.dump(comparison_results, f, indent=2, default=str)
         
-        logger.info(f"Performance comparison report saved: {report_file}")
+        logger.info("Performance comparison report saved: %s", report_file)
     
     def _save_benchmark_report(self, benchmark_results: Dict[str, Any]):
         """Save comprehensive benchmark report to file."""
@@ -491,7 +491,7 @@ class PerformanceComparator:
         with open(report_file, 'w') as f:
             json.dump(benchmark_results, f, indent=2, default=str)
         
-        logger.info(f"Comprehensive benchmark report saved: {report_file}")
+        logger.info("Comprehensive benchmark report saved: %s", report_file)
     
     def _create_performance_visualizations(self, comparison_results: Dict[str, Any]):
         """Create performance visualization charts."""
@@ -567,10 +567,10 @@ class PerformanceComparator:
             plt.savefig(chart_file, dpi=300, bbox_inches='tight')
             plt.close()
             
-            logger.info(f"Performance visualization saved: {chart_file}")
+            logger.info("Performance visualization saved: %s", chart_file)
             
         except Exception as e:
-            logger.error(f"Error creating visualizations: {e}")
+            logger.error("Error creating visualizations: %s", e)
     
     def _create_benchmark_visualizations(self, benchmark_results: Dict[str, Any]):
         """Create comprehensive benchmark visualization charts."""
@@ -628,10 +628,10 @@ class PerformanceComparator:
             plt.savefig(chart_file, dpi=300, bbox_inches='tight')
             plt.close()
             
-            logger.info(f"Benchmark visualization saved: {chart_file}")
+            logger.info("Benchmark visualization saved: %s", chart_file)
             
         except Exception as e:
-            logger.error(f"Error creating benchmark visualizations: {e}")
+            logger.error("Error creating benchmark visualizations: %s", e)
 
 
 def demo_performance_comparison():
@@ -650,10 +650,10 @@ def demo_performance_comparison():
     building_files = list(dummy_dir.glob("*.json"))
     
     if not building_files:
-        logger.error(f"No building files found in {dummy_dir}")
+        logger.error("No building files found in %s", dummy_dir)
         return
     
-    logger.info(f"Found {len(building_files)} building files for performance comparison")
+    logger.info("Found %s building files for performance comparison", len(building_files))
     
     # Create performance comparator
     comparator = PerformanceComparator(
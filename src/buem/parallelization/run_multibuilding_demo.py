@@ -86,15 +86,15 @@ def check_dependencies():
     for name, module in dependencies.items():
         try:
             __import__(module)
-            logger.info(f"✅ {name} is available")
+            logger.info("✅ %s is available", name)
         except ImportError:
             missing_deps.append(name)
-            logger.warning(f"❌ {name} is missing")
+            logger.warning("❌ %s is missing", name)
     
     if missing_deps:
-        logger.error(f"Missing dependencies: {', '.join(missing_deps)}")
+        logger.error("Missing dependencies: %s", ', '.join(missing_deps))
         logger.info("Please install missing dependencies using conda:")
-        logger.info(f"conda install {' '.join(missing_deps)}")
+        logger.info("conda install %s", ' '.join(missing_deps))
         return False
     
     return True
@@ -111,9 +111,9 @@ def check_dummy_buildings() -> List[Path]:
         logger.info("Expected location: src/buem/data/buildings/dummy/")
         return []
     
-    logger.info(f"Found {len(building_files)} dummy building files:")
+    logger.info("Found %s dummy building files:", len(building_files))
     for file in building_files:
-        logger.info(f"  🏢 {file.name}")
+        logger.info("  🏢 %s", file.name)
     
     return building_files
 
@@ -129,7 +129,7 @@ def run_parallel_demo():
         logger.info("✅ Parallel processing demonstration completed successfully")
         return results
     except Exception as e:
-        logger.error(f"❌ Parallel processing demonstration failed: {e}")
+        logger.error("❌ Parallel processing demonstration failed: %s", e)
         return None
 
 
@@ -144,7 +144,7 @@ def run_sequential_demo():
         logger.info("✅ Sequential processing demonstration completed successfully")
         return results
     except Exception as e:
-        logger.error(f"❌ Sequential processing demonstration failed: {e}")
+        logger.error("❌ Sequential processing demonstration failed: %s", e)
         return None
 
 
@@ -159,7 +159,7 @@ def run_comparison_demo():
         logger.info("✅ Performance comparison demonstration completed successfully")
         return results
     except Exception as e:
-        logger.error(f"❌ Performance comparison demonstration failed: {e}")
+        logger.error("❌ Performance comparison demonstration failed: %s", e)
         return None
 
 
@@ -189,7 +189,7 @@ def run_benchmark_demo():
         logger.info("✅ Comprehensive benchmark completed successfully")
         return results
     except Exception as e:
-        logger.error(f"❌ Comprehensive benchmark failed: {e}")
+        logger.error("❌ Comprehensive benchmark failed: %s", e)
         return None
 
 
@@ -432,7 +432,7 @@ def run_optimization_tests(building_files: List[Path]) -> Dict[str, Any]:
     results = []
     
     for i, config in enumerate(test_configs, 1):
-        logger.info(f"\\n📊 Test {i}/{len(test_configs)}: {config['desc']}")
+        logger.info("\\n📊 Test %s/%s: %s", i, len(test_configs), config['desc'])
         start_time = time.time()
         
         try:
@@ -457,12 +457,12 @@ def run_optimization_tests(building_files: List[Path]) -> Dict[str, Any]:
             
             results.append(config_result)
             
-            logger.info(f"   ⏱️  Time: {config_result['test_time']:.1f}s")
-            logger.info(f"   🚀 Rate: {config_result['buildings_per_second']:.2f} buildings/sec")
-            logger.info(f"   ✅ Success: {config_result['success_rate']:.1%}")
+            logger.info("   ⏱️  Time: %.1fs", config_result['test_time'])
+            logger.info("   🚀 Rate: %.2f buildings/sec", config_result['buildings_per_second'])
+            logger.info("   ✅ Success: %.1f%%", config_result['success_rate'] * 100)
             
         except Exception as e:
-            logger.warning(f"   ❌ Test failed: {e}")
+            logger.warning("   ❌ Test failed: %s", e)
             results.append({
                 'config': config,
                 'status': 'failed',
@@ -477,10 +477,10 @@ def run_optimization_tests(building_files: List[Path]) -> Dict[str, Any]:
         optimal_config = max(successful_results, 
                            key=lambda x: x['buildings_per_second'] * x['success_rate'])
         
-        logger.info(f"\\n🏆 Optimal Configuration Found:")
-        logger.info(f"   📋 Config: {optimal_config['config']['desc']}")
-        logger.info(f"   🚀 Performance: {optimal_config['buildings_per_second']:.2f} buildings/sec")
-        logger.info(f"   ✅ Success Rate: {optimal_config['success_rate']:.1%}")
+        logger.info("\\n🏆 Optimal Configuration Found:")
+        logger.info("   📋 Config: %s", optimal_config['config']['desc'])
+        logger.info("   🚀 Performance: %.2f buildings/sec", optimal_config['buildings_per_second'])
+        logger.info("   ✅ Success Rate: %.1f%%", optimal_config['success_rate'] * 100)
         
         return {
             'optimal_config': optimal_config['config'],
@@ -519,7 +519,7 @@ def run_enhanced_parallel_demo(workers: int):
         logger.info("Enhanced parallel processing demonstration completed successfully")
         return results
     except Exception as e:
-        logger.error(f"Enhanced parallel processing demonstration failed: {e}")
+        logger.error("Enhanced parallel processing demonstration failed: %s", e)
         return None
 
 
@@ -538,7 +538,7 @@ def run_worker_scaling_tests():
     results = {}
     
     for workers in worker_counts:
-        logger.info(f"\\n Testing {workers} worker(s)...")
+        logger.info("\\n Testing %s worker(s)...", workers)
         try:
             from buem.parallelization.parallel_run import ParallelBuildingProcessor
             
@@ -557,17 +557,17 @@ def run_worker_scaling_tests():
                 'success_rate': result['summary']['success_rate_percent']
             }
             
-            logger.info(f"   {workers} worker(s): {result['performance']['total_time']:.2f}s, {result['performance']['buildings_per_second']:.2f} buildings/sec")
+            logger.info("   %s worker(s): %.2fs, %.2f buildings/sec", workers, result['performance']['total_time'], result['performance']['buildings_per_second'])
             
         except Exception as e:
-            logger.error(f"   {workers} worker(s) failed: {e}")
+            logger.error("   %s worker(s) failed: %s", workers, e)
             results[workers] = {'status': 'failed', 'error': str(e)}
     
     # Compare results
     successful = {k: v for k, v in results.items() if v['status'] == 'success'}
     if len(successful) >= 2:
         best_workers = max(successful, key=lambda k: successful[k]['rate'])
-        logger.info(f"\\n Best configuration: {best_workers} worker(s) at {successful[best_workers]['rate']:.2f} buildings/sec")
+        logger.info("\\n Best configuration: %s worker(s) at %.2f buildings/sec", best_workers, successful[best_workers]['rate'])
     
     return results
 
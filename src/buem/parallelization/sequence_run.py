@@ -39,6 +39,7 @@ Performance Notes:
 """
 
 import json
+import orjson
 import time
 import logging
 import traceback
@@ -114,7 +115,7 @@ def process_single_building_sequential(building_file: Union[str, Path]) -> Dict[
         else:
             building_id = building_file.stem
         
-        logger.info(f"Processing building: {building_id} (sequential)")
+        logger.info("Processing building: %s (sequential)", building_id)
         
         # Validate the building configuration
         validation_start = time.time()
@@ -172,7 +173,8 @@ def process_single_building_sequential(building_file: Union[str, Path]) -> Dict[
         total_time = time.time() - start_time
         stats['total_time'] = total_time
         error_msg = f"Error processing {building_file}: {str(e)}"
-        logger.error(f"{error_msg}\\n{traceback.format_exc()}")
+        tb = traceback.format_exc()  # formatted once, used for the log and the result
+        logger.error("%s\n%s", error_msg, tb)
         
         return {
             'building_id': building_file.stem,
@@ -185,7 +187,7 @@ def process_single_building_sequential(building_file: Union[str, Path]) -> Dict[
                 'processed_at': datetime.now(timezone.utc).isoformat(),
                 'validation_passed': False,
                 'processing_mode': 'sequential',
-                'traceback': traceback.format_exc()
+                'traceback': tb
             }
         }
 
@@ -239,7 +241,7 @@ class SequentialBuildingProcessor:
         
         if self.memory_monitoring:
             memory_info = psutil.virtual_memory()
-            logger.info(f"System memory: {memory_info.total / (1024**3):.1f} GB available")
+            logger.info("System memory: %.1f GB available", memory_info.total / (1024**3))
     
     def process_buildings(
         self, 
@@ -271,7 +273,7 @@ class SequentialBuildingProcessor:
         start_time = time.time()
         total_buildings = len(building_files)
         
-        logger.info(f"Starting sequential processing of {total_buildings} buildings")
+        logger.info("Starting sequential processing of %s buildings", total_buildings)
         
         # Initialize results tracking
         completed_buildings = []
@@ -302,15 +304,14 @@ class SequentialBuildingProcessor:
                         result['success'] = False
                         result['error'] = f"Processing timeout ({self.timeout}s)"
                         failed_buildings.append(result)
-                        logger.error(f"⏱️ Timeout: {result['building_id']}")
+                        logger.error("⏱️ Timeout: %s", result['building_id'])
                     elif result['success']:
                         completed_buildings.append(result)
                         if self.detailed_logging:
-                            logger.info(f"✅ Completed: {result['building_id']} "
-                                      f"({result['processing_time']:.2f}s)")
+                            logger.info("✅ Completed: %s (%.2fs)", result['building_id'], result['processing_time'])
                     else:
                         failed_buildings.append(result)
-                        logger.error(f"❌ Failed: {result['building_id']} - {result['error']}")
+                        logger.error("❌ Failed: %s - %s", result['building_id'], result['error'])
                     
                     # Record detailed timing
                     building_time = time.time() - building_start_time
@@ -332,7 +333,7 @@ class SequentialBuildingProcessor:
                             'memory_mb': current_memory
                         })
                         if self.detailed_logging:
-                            logger.info(f"Memory usage: {current_memory:.1f} MB")
+                            logger.info("Memory usage: %.1f MB", current_memory)
                     
                 except Exception as e:
                     error_result = {
@@ -346,14 +347,14 @@ class SequentialBuildingProcessor:
                         }
                     }
                     failed_buildings.append(error_result)
-                    logger.error(f"💥 Error: {error_result['building_id']} - {str(e)}")
+                    logger.error("💥 Error: %s - %s", error_result['building_id'], str(e))
         
         except KeyboardInterrupt:
             logger.warning("Processing interrupted by user")
             raise
         
         except Exception as e:
-            logger.error(f"Critical error in sequential processing: {str(e)}")
+            logger.error("Critical error in sequential processing: %s", str(e))
             raise
         
         # Calculate performance metrics
@@ -410,24 +411,28 @@ class SequentialBuildingProcessor:
                 results_dir = Path(__file__).resolve().parent.parent / "results"
                 results_dir.mkdir(parents=True, exist_ok=True)
                 results_file = str(results_dir / f"sequential_processing_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            with open(results_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-            logger.info(f"Results saved to: {results_file}")
+            # orjson encodes numpy values natively; str() stays the fallback for other types
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    results, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+            logger.info("Results saved to: %s", results_file)
             results['results_file'] = results_file
         
         # Log summary
-        logger.info(f"🎯 Sequential Processing Summary:")
-        logger.info(f"   Total buildings: {total_buildings}")
-        logger.info(f"   ✅ Successful: {successful_count}")
-        logger.info(f"   ❌ Failed: {failed_count}")
-        logger.info(f"   📊 Success rate: {performance_metrics['success_rate']:.1%}")
-        logger.info(f"   ⏱️ Total time: {total_time:.2f}s")
-        logger.info(f"   🐌 Rate: {performance_metrics['buildings_per_second']:.2f} buildings/sec")
-        logger.info(f"   ⚡ Avg time per building: {performance_metrics['average_time_per_building']:.2f}s")
+        logger.info("🎯 Sequential Processing Summary:")
+        logger.info("   Total buildings: %s", total_buildings)
+        logger.info("   ✅ Successful: %s", successful_count)
+        logger.info("   ❌ Failed: %s", failed_count)
+        logger.info("   📊 Success rate: %.1f%%", performance_metrics['success_rate'] * 100)
+        logger.info("   ⏱️ Total time: %.2fs", total_time)
+        logger.info("   🐌 Rate: %.2f buildings/sec", performance_metrics['buildings_per_second'])
+        logger.info("   ⚡ Avg time per building: %.2fs", performance_metrics['average_time_per_building'])
         
         if self.memory_monitoring:
-            logger.info(f"   💾 Memory increase: {performance_metrics['memory_increase_mb']:.1f} MB")
-            logger.info(f"   📈 Peak memory: {performance_metrics['peak_memory_mb']:.1f} MB")
+            logger.info("   💾 Memory increase: %.1f MB", performance_metrics['memory_increase_mb'])
+            logger.info("   📈 Peak memory: %.1f MB", performance_metrics['peak_memory_mb'])
         
         return results
 
@@ -444,15 +449,15 @@ def demo_sequential_processing():
     building_files = list(dummy_dir.glob("*.json"))
     
     if not building_files:
-        logger.error(f"No building files found in {dummy_dir}")
+        logger.error("No building files found in %s", dummy_dir)
         return
     
-    logger.info(f"Found {len(building_files)} building files for sequential processing")
+    logger.info("Found %s building files for sequential processing", len(building_files))
     
     def progress_handler(completed: int, total: int):
         """Simple progress handler for demonstration."""
         progress = (completed / total) * 100
-        logger.info(f"Sequential Progress: {completed}/{total} ({progress:.1f}%)")
+        logger.info("Sequential Progress: %s/%s (%.1f%%)", completed, total, progress)
     
     # Create sequential processor
     processor = SequentialBuildingProcessor(
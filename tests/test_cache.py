@@ -61,3 +61,24 @@ def test_result_cache_dir():
     cache_dir = str(CACHE_DIR)
     # Directory may or may not exist yet — just verify the path is set
     assert cache_dir, "CACHE_DIR should be a non-empty path"
+
+
+@pytest.mark.skipif(_skip_reason is not None, reason=_skip_reason or "")
+def test_save_timeseries_npz_roundtrip(tmp_path):
+    """The npz format stores the index as UTC epoch ns next to the float64 loads."""
+    import numpy as np
+    import pandas as pd
+
+    proc = GeoJsonProcessor(payload={}, result_save_dir=str(tmp_path), timeseries_format="npz")
+    utc = pd.date_range("2018-01-01", periods=3, freq="h", tz="UTC")
+    indexes = (utc, utc.tz_localize(None), utc.tz_convert("Europe/Berlin"), utc.as_unit("us"))
+    for idx in indexes:
+        fname = proc._save_timeseries(idx, np.array([1.0, 2.0, 3.0]), np.zeros(3), np.ones(3))
+
+        assert fname.endswith(".npz")
+        data = np.load(tmp_path / fname)
+        assert data["index"].dtype == np.int64
+        assert data["index"].tolist() == [1514764800 * 10**9 + h * 3600 * 10**9 for h in range(3)]
+        assert (pd.to_datetime(data["index"], unit="ns", utc=True) == utc).all()
+        assert data["heat"].tolist() == [1.0, 2.0, 3.0]
+        assert set(data.files) == {"index", "heat", "cool", "electricity"}
@@ -0,0 +1,273 @@
+"""Unit tests for the buem.config package (attribute specs, CfgBuilding, validator)."""
+from buem.config import cfg_attribute
+
+
+def test_default_cfg_is_built_once_and_exposed_lazily():
+    specs = cfg_attribute.get_attribute_specs()
+    assert cfg_attribute.get_attribute_specs() is specs
+    assert cfg_attribute.ATTRIBUTE_SPECS is specs
+    assert cfg_attribute.cfg is cfg_attribute.get_default_cfg()
+    assert cfg_attribute.cfg["weather"] is specs["weather"].default
+    assert set(cfg_attribute.cfg) == set(specs)
+
+
+def test_cfg_building_from_mapping_matches_json_constructor():
+    import json
+    from buem.config.cfg_building import CfgBuilding
+
+    payload = {"occControl": True, "A_ref": 120.0}
+    from_dict = CfgBuilding.from_mapping(payload).to_cfg_dict()
+    from_json = CfgBuilding(json.dumps(payload)).to_cfg_dict()
+    assert from_dict["A_ref"] == from_json["A_ref"] == 120.0
+    assert from_dict["occControl"] is from_json["occControl"]
+    assert payload == {"occControl": True, "A_ref": 120.0}
+
+
+def test_spec_keys_by_category_are_grouped_once():
+    from buem.config.attribute_types import AttributeCategory
+    from buem.config.cfg_building import _get_spec_keys_by_category
+
+    bools = _get_spec_keys_by_category(AttributeCategory.BOOLEAN)
+    assert _get_spec_keys_by_category(AttributeCategory.BOOLEAN) is bools
+    assert "occControl" in bools
+    assert all(spec.category is AttributeCategory.BOOLEAN for spec in bools.values())
+
+
+def test_attribute_spec_is_frozen():
+    import dataclasses
+    import pytest
+    from buem.config.attribute_types import AttributeCategory, AttributeSpec, AttrType
+
+    spec = AttributeSpec("A_ref", AttributeCategory.FIXED, AttrType.FLOAT, 100.0)
+    assert not hasattr(spec, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.default = 1.0
+
+
+def test_copy_default_shares_pandas_buffers_but_copies_containers():
+    import numpy as np
+    import pandas as pd
+    from buem.config.cfg_building import _copy_default
+
+    series = pd.Series(np.arange(3.0))
+    copied = _copy_default(series)
+    assert copied is not series
+    assert np.shares_memory(copied.to_numpy(), series.to_numpy())
+
+    comps = {"Walls": {"elements": [{"id": "W1"}]}}
+    assert _copy_default(comps) == comps
+    assert _copy_default(comps)["Walls"] is not comps["Walls"]
+    assert _copy_default(1.5) == 1.5
+
+
+def test_cfg_building_to_json_round_trips_through_from_json_file(tmp_path):
+    import orjson
+    from buem.config.cfg_building import CfgBuilding
+
+    cfgb = CfgBuilding.from_mapping({"A_ref": 120.0})
+    text = cfgb.to_json()
+    doc = orjson.loads(text)
+    assert doc["A_ref"] == 120.0
+    assert len(doc["weather"]["index"]) == cfgb.weather.n_hours
+
+    path = tmp_path / "cfg.json"
+    path.write_text(text, encoding="utf-8")
+    assert CfgBuilding.from_json_file(str(path)).to_cfg_dict()["A_ref"] == 120.0
+
+
+def test_iso_strings_match_timestamp_isoformat():
+    import pandas as pd
+    from buem.config.cfg_building import _df_to_serializable, _iso_strings
+
+    for idx in (
+        pd.date_range("2018-01-01", periods=3, freq="h"),
+        pd.date_range("2018-01-01", periods=3, freq="h", tz="UTC"),
+        pd.date_range("2018-01-01", periods=3, freq="h", tz="Europe/Berlin"),
+        pd.date_range("2018-01-01", periods=3, freq="500ms"),
+    ):
+        assert _iso_strings(idx) == [ts.isoformat() for ts in idx]
+
+    out = _df_to_serializable(pd.DataFrame({"T": [1.0, 2.0]}, index=pd.date_range("2018-01-01", periods=2, freq="h")))
+    assert out["T"].tolist() == [1.0, 2.0]
+
+
+def test_to_cfg_dict_copies_components_but_shares_weather():
+    from buem.config.cfg_building import CfgBuilding
+
+    cfgb = CfgBuilding.from_mapping({"A_ref": 120.0})
+    first, second = cfgb.to_cfg_dict(), cfgb.to_cfg_dict()
+    assert first["weather"] is second["weather"]
+    assert first["components"] == second["components"]
+    assert first["components"] is not second["components"]
+
+
+def test_default_occupancy_profiles_match_original_formulas():
+    import numpy as np
+
+    specs = cfg_attribute.get_attribute_specs()
+    n = len(specs["weather"].default)
+    nothome = 0.5 * (1 + np.sin(np.linspace(-np.pi/2, 3*np.pi/2, n)))
+    sleeping = 0.5 * (1 - np.cos(np.linspace(0, 2*np.pi, n)))
+    np.testing.assert_allclose(specs["occ_nothome"].default.to_numpy(), nothome, atol=1e-12)
+    np.testing.assert_allclose(specs["occ_sleeping"].default.to_numpy(), sleeping, atol=1e-12)
+
+
+def test_to_serializable_value_dispatches_on_attr_type():
+    import numpy as np
+    from buem.config.cfg_building import _to_serializable_value
+
+    comps = {"Walls": {"U": 1.6, "elements": []}}
+    assert _to_serializable_value("components", comps) is comps
+    assert _to_serializable_value("A_ref", np.float64(2.5)) == 2.5
+    assert _to_serializable_value("not_a_spec", {1, 2}) == str({1, 2})
+
+
+def test_weather_config_builds_dataframe_lazily_from_columns():
+    from buem.config.cfg_building import WeatherConfig
+
+    index = ["2018-01-01T00:00:00", "2018-01-01T01:00:00"]
+    weather = WeatherConfig({"index": index, "T": [1.0, 2.0], "GHI": [0.0, 5.0]})
+    assert weather.n_hours == 2
+    assert weather._df is None
+    assert weather.to_serializable()["index"] == index
+    assert list(weather.df.columns) == ["T", "GHI"]
+    assert weather.df is weather.df
+
+
+def test_weather_config_parses_iso_index_with_offset():
+    import pandas as pd
+    from buem.config.cfg_building import WeatherConfig
+
+    weather = WeatherConfig({"index": ["2018-01-01T00:00:00+00:00", "2018-01-01T01:00:00+00:00"], "T": [1.0, 2.0]})
+    expected = pd.DatetimeIndex(["2018-01-01 00:00", "2018-01-01 01:00"], tz="UTC")
+    assert weather.index.tz_convert("UTC").equals(expected)
+
+
+def test_weather_config_reuses_parsed_index_across_instances():
+    from buem.config.cfg_building import WeatherConfig
+
+    index = ["2018-01-01T00:00:00", "2018-01-01T01:00:00"]
+    first = WeatherConfig({"index": index, "T": [1.0, 2.0]})
+    second = WeatherConfig({"index": list(index), "T": [3.0, 4.0]})
+    assert first.index is second.index
+    assert second.df["T"].tolist() == [3.0, 4.0]
+
+
+def test_align_series_skips_reindex_on_matching_index():
+    import pandas as pd
+    from buem.config.cfg_building import _align_series
+
+    idx = pd.date_range("2018-01-01", periods=3, freq="h")
+    s = pd.Series([1.0, 2.0, 3.0], index=idx)
+    assert _align_series(s, idx) is s
+    assert _align_series(s, pd.date_range("2018-01-01", periods=3, freq="h")) is s
+    shifted = _align_series(s, idx[1:].append(pd.DatetimeIndex(["2018-01-01 03:00"])))
+    assert shifted.iloc[:2].tolist() == [2.0, 3.0]
+    assert pd.isna(shifted.iloc[2])
+
+
+def test_defaults_are_injected_without_serialization_round_trip():
+    import pandas as pd
+    from buem.config.cfg_building import CfgBuilding
+
+    specs = cfg_attribute.get_attribute_specs()
+    cfg = CfgBuilding.from_mapping({}).to_cfg_dict()
+    pd.testing.assert_frame_equal(cfg["weather"], specs["weather"].default)
+    pd.testing.assert_series_equal(cfg["occ_sleeping"], specs["occ_sleeping"].default)
+    assert cfg["A_ref"] == specs["A_ref"].default
+
+
+def test_series_defaults_stay_lists_for_non_8760_weather():
+    import orjson
+    import pandas as pd
+    from buem.config.cfg_building import CfgBuilding
+
+    index = pd.date_range("2018-01-01", periods=24, freq="h").strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    weather = {"index": index, "T": [5.0] * 24, "GHI": [0.0] * 24, "DNI": [0.0] * 24, "DHI": [0.0] * 24}
+    cfgb = CfgBuilding.from_mapping({"weather": weather})
+
+    default = cfg_attribute.get_attribute_specs()["occ_sleeping"].default
+    doc = orjson.loads(cfgb.to_json())
+    assert doc["occ_sleeping"] == default.tolist()
+    assert isinstance(cfgb.to_cfg_dict()["elecLoad"], list)
+    assert CfgBuilding.from_mapping(doc).to_cfg_dict()["occ_sleeping"] == default.tolist()
+
+
+def test_update_from_dict_skips_rebuild_on_idempotent_update():
+    from buem.config.cfg_building import CfgBuilding
+
+    cfg = CfgBuilding.from_mapping({"A_ref": 120.0, "occControl": True})
+    internal = cfg._cfg
+    assert cfg.update_from_dict({"A_ref": 120.0, "occControl": True}) is False
+    assert cfg._cfg is internal
+    assert cfg.update_from_dict({"A_ref": 90.0}) is True
+    assert cfg._cfg is not internal
+    assert cfg.to_cfg_dict()["A_ref"] == 90.0
+
+
+def _valid_components():
+    return {
+        comp: {"U": 1.0, "elements": [{"id": f"{comp}_1", "area": 10.0}]}
+        for comp in ("Walls", "Windows", "Roof", "Floor", "Doors")
+    }
+
+
+def test_validate_cfg_accepts_valid_cfg_and_reports_element_issues():
+    from buem.config.validator import validate_cfg
+
+    comps = _valid_components()
+    assert validate_cfg({"components": comps, "weather": [1.0]}) == []
+
+    comps["Roof"] = {"elements": [{"id": "Walls_1", "area": 0}, "bad"]}
+    comps["Doors"] = {"U": "x"}
+    assert validate_cfg({"components": comps}) == [
+        "duplicate element id 'Walls_1' in components",
+        "components.Roof.elements[0].area must be > 0",
+        "components.Roof.elements[0].U missing",
+        "components.Roof.elements[1] not an object",
+        "components.Doors.U invalid: x",
+        "weather missing",
+    ]
+
+
+def test_positive_matches_float_comparison():
+    from buem.config.validator import _positive
+
+    assert _positive(2) is True
+    assert _positive(0.0) is False
+    assert _positive("1.5") is True
+    assert _positive(True) is True
+    assert _positive(float("nan")) is True
+    assert _positive("x") is None
+    assert _positive(None) is None
+
+
+def test_validate_cfg_bulk_element_checks_match_per_element_messages():
+    from buem.config.validator import validate_cfg
+
+    comps = _valid_components()
+    comps["Walls"] = {"elements": [{"id": f"W{i}", "area": 5.0, "U": 0.3} for i in range(12)]}
+    assert validate_cfg({"components": comps, "weather": [1.0]}) == []
+
+    comps["Walls"]["elements"][9]["area"] = -1.0
+    comps["Walls"]["elements"][10]["U"] = "bad"
+    assert validate_cfg({"components": comps, "weather": [1.0]}) == [
+        "components.Walls.elements[9].area must be > 0",
+        "components.Walls.elements[10].U invalid: bad",
+    ]
+
+
+def test_validate_cfg_reuses_issues_for_repeated_components():
+    from buem.config.validator import _cached_component_issues, validate_cfg
+
+    comps = _valid_components()
+    comps["Doors"] = {"U": -1.0}
+    _cached_component_issues.cache_clear()
+    first = validate_cfg({"components": comps, "weather": [1.0]})
+    second = validate_cfg({"components": _valid_components() | {"Doors": {"U": -1.0}}})
+    assert first == ["components.Doors.U must be positive number"]
+    assert second == first + ["weather missing"]
+    assert _cached_component_issues.cache_info().hits == 1
+
+    comps["Doors"] = {"U": None, "elements": [{"id": "D1", "area": float("nan"), "U": 1.0}]}
+    assert validate_cfg({"components": comps, "weather": [1.0]}) == []
@@ -0,0 +1,40 @@
+"""Tests for the result download endpoint in buem.apis.files_api."""
+from flask import Flask
+
+from buem.apis import files_api
+
+
+def _client(tmp_path, monkeypatch, prefix):
+    monkeypatch.setattr(files_api, "RESULTS_DIR", str(tmp_path))
+    monkeypatch.setattr(files_api, "X_ACCEL_PREFIX", prefix)
+    app = Flask(__name__)
+    app.register_blueprint(files_api.bp)
+    return app.test_client()
+
+
+def test_download_delegates_to_nginx_when_prefix_set(tmp_path, monkeypatch):
+    (tmp_path / "ts.json.gz").write_bytes(b"data")
+    client = _client(tmp_path, monkeypatch, "/internal/results/")
+
+    resp = client.get("/api/files/ts.json.gz")
+    assert resp.status_code == 200
+    assert resp.headers["X-Accel-Redirect"] == "/internal/results/ts.json.gz"
+    assert resp.mimetype == "application/gzip"
+    assert resp.data == b""
+    assert client.get("/api/files/missing.json").status_code == 404
+
+
+def test_download_streams_file_without_prefix(tmp_path, monkeypatch):
+    (tmp_path / "ts.json").write_bytes(b"{}")
+    client = _client(tmp_path, monkeypatch, None)
+
+    resp = client.get("/api/files/ts.json")
+    assert resp.status_code == 200
+    assert resp.data == b"{}"
+    assert "X-Accel-Redirect" not in resp.headers
+
+
+def test_results_dir_is_created_at_registration(tmp_path, monkeypatch):
+    results = tmp_path / "results"
+    _client(results, monkeypatch, None)
+    assert results.is_dir()
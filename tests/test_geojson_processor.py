@@ -0,0 +1,67 @@
+"""Tests for the feature pools of GeoJsonProcessor (model runs replaced by a stub)."""
+import copy
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+BUILDING_FILE = Path(__file__).resolve().parent.parent / "src" / "buem" / "data" / "buildings" / "dummy" / "building_01_small_residential.json"
+
+_skip_reason = None
+try:
+    from buem.integration.scripts.geojson_processor import GeoJsonProcessor
+except ImportError as e:
+    _skip_reason = f"GeoJsonProcessor unavailable: {e}"
+    GeoJsonProcessor = object
+
+
+class _StubProcessor(GeoJsonProcessor):
+    """Records which feature ran in which process instead of running the model."""
+
+    def _process_single_feature(self, feature, warning_msgs):
+        if feature["id"] == "fail":
+            raise RuntimeError("boom")
+        feature["properties"]["buem"]["thermal_load_profile"] = {"feature_id": feature["id"], "pid": os.getpid()}
+        return feature
+
+
+def _payload(ids):
+    with open(BUILDING_FILE) as f:
+        template = json.load(f)["features"][0]
+    features = []
+    for fid in ids:
+        feat = copy.deepcopy(template)
+        feat["id"] = fid
+        features.append(feat)
+    return {"type": "FeatureCollection", "features": features}
+
+
+@pytest.mark.skipif(_skip_reason is not None, reason=_skip_reason or "")
+def test_process_pool_keeps_feature_order():
+    ids = [f"B{i}" for i in range(4)]
+    resp = _StubProcessor(_payload(ids), max_workers=2, executor="process").process()
+
+    profiles = [feat["properties"]["buem"]["thermal_load_profile"] for feat in resp["features"]]
+    assert [p["feature_id"] for p in profiles] == ids
+    assert all(p["pid"] != os.getpid() for p in profiles)
+    assert resp["metadata"]["successful_features"] == 4
+
+
+@pytest.mark.skipif(_skip_reason is not None, reason=_skip_reason or "")
+def test_thread_pool_keeps_order_and_records_failures():
+    ids = ["B0", "fail", "B2", "B3"]
+    resp = _StubProcessor(_payload(ids), max_workers=2, executor="thread").process()
+
+    assert [feat["id"] for feat in resp["features"]] == ids
+    assert resp["features"][1]["properties"]["buem"]["error"]["message"] == "boom"
+    assert resp["features"][2]["properties"]["buem"]["thermal_load_profile"]["feature_id"] == "B2"
+    assert resp["metadata"]["failed_features"] == 1
+    assert len(resp["validation_report"]["processing_errors"]) == 1
+
+
+@pytest.mark.skipif(_skip_reason is not None, reason=_skip_reason or "")
+@pytest.mark.parametrize("raw, expected", [("3", 3), ("0", 1), ("-2", 1), ("two", 1)])
+def test_feature_workers_env_is_validated(monkeypatch, raw, expected):
+    monkeypatch.setenv("BUEM_FEATURE_WORKERS", raw)
+    assert GeoJsonProcessor({}).max_workers == expected
@@ -0,0 +1,73 @@
+"""Tests for the marshmallow-based GeoJSON validator."""
+
+
+def test_geojson_validator_is_shared_per_strict_mode():
+    """validate_geojson_request reuses one validator (and schema tree) per strict_mode."""
+    from buem.integration.scripts.geojson_validator import _get_validator, validate_geojson_request
+
+    assert _get_validator(False) is _get_validator(False)
+    assert _get_validator(True) is not _get_validator(False)
+    assert _get_validator(True).strict_mode
+    assert not validate_geojson_request({"type": "FeatureCollection"}).is_valid
+
+
+def test_geojson_element_schema_reports_range_messages():
+    """Out-of-range element fields report the violated bound, blank ids the id message."""
+    from buem.integration.scripts.geojson_validator import ComponentElementSchema
+
+    errors = ComponentElementSchema().validate({"id": " ", "area": 0.0, "azimuth": 400.0, "tilt": 30.0})
+    assert errors["azimuth"] == ["Azimuth must be between 0 and 360 degrees"]
+    assert errors["id"] == ["Element ID cannot be empty"]
+    assert "area" in errors
+
+
+def test_validation_result_buckets_issues_by_level():
+    """Issues from the constructor and add_issue land in their level's bucket, in order."""
+    from buem.integration.scripts.geojson_validator import ValidationIssue, ValidationLevel, ValidationResult
+
+    result = ValidationResult(is_valid=True, issues=[ValidationIssue(ValidationLevel.WARNING, "w0", "a")])
+    result.add_issue(ValidationLevel.INFO, "i0", "b")
+    result.add_issue(ValidationLevel.ERROR, "e0", "c")
+    result.add_issue(ValidationLevel.WARNING, "w1", "d")
+
+    assert [i.message for i in result.get_warnings()] == ["w0", "w1"]
+    assert [i.message for i in result.get_errors()] == ["e0"]
+    assert [i.message for i in result.get_infos()] == ["i0"]
+    assert not result.is_valid
+    assert result.summary() == "Validation failed: 1 errors, 2 warnings"
+
+
+def test_child_components_are_grouped_with_default_u_values():
+    """child_components convert to nested components; default U only where no element has one."""
+    from buem.integration.scripts.geojson_validator import GeoJsonValidator
+
+    def child(cid, ctype, u=None):
+        return {"component_id": cid, "component_type": ctype, "area_m2": 10.0,
+                "orientation_deg": 180.0, "tilt_deg": 90.0, "u_value": u}
+
+    components = GeoJsonValidator()._child_to_nested_components([
+        child("W1", "Wall"), child("R1", "roof", 0.2), child("W2", "wall"), child("Win1", "window"),
+    ])
+    assert list(components) == ["Walls", "Roof", "Windows"]
+    assert [e["id"] for e in components["Walls"]["elements"]] == ["W1", "W2"]
+    assert components["Walls"]["U"] == 1.6
+    assert "U" not in components["Roof"] and components["Roof"]["elements"][0]["U"] == 0.2
+    assert components["Windows"] == {"elements": components["Windows"]["elements"], "U": 2.5, "g_gl": 0.5}
+
+
+def test_flatten_errors_keeps_tree_order_and_paths():
+    """Nested marshmallow errors flatten depth-first in input order with dotted paths."""
+    from buem.integration.scripts.geojson_validator import GeoJsonValidator, ValidationResult
+
+    errors = {"features": {0: {"id": ["Missing data for required field."],
+                               "geometry": {"type": ["Must be equal to Point."]}}},
+              "type": ["Must be one of: FeatureCollection, Feature."]}
+    result = ValidationResult(is_valid=True)
+    GeoJsonValidator()._flatten_errors(errors, result, "")
+
+    assert [(i.path, i.message) for i in result.issues] == [
+        ("features.0.id", "Missing data for required field."),
+        ("features.0.geometry.type", "Must be equal to Point."),
+        ("type", "Must be one of: FeatureCollection, Feature."),
+    ]
+    assert result.issues[0].suggestion == "Add the required 'id' field"
@@ -0,0 +1,161 @@
+"""Unit tests for the response helpers in buem.apis.model_api."""
+import numpy as np
+import pandas as pd
+
+from buem.apis.model_api import (
+    _gzip_if_accepted, _internal_error, _parse_bool_flag, _summarize_loads, _to_serializable_timeseries,
+)
+
+
+def test_timeseries_serialization_matches_isoformat():
+    times = pd.date_range("2018-01-01", periods=3, freq="h")
+    out = _to_serializable_timeseries(times, np.array([1, 2, 3]))
+    assert out["index"] == [ts.isoformat() for ts in times]
+    assert out["values"] == [1.0, 2.0, 3.0]
+
+
+def test_timeseries_serialization_matches_isoformat_for_tz_aware_index():
+    utc = pd.date_range("2018-01-01", periods=2, freq="h", tz="UTC")
+    berlin = pd.DatetimeIndex(["2018-01-01 00:00:00.5", "2018-07-01 01:00"]).tz_localize("Europe/Berlin")
+    for times in (utc, berlin):
+        out = _to_serializable_timeseries(times, np.array([1.0, 2.0]))
+        assert out["index"] == [ts.isoformat() for ts in times]
+    assert _to_serializable_timeseries(utc, np.array([1.0, 2.0]))["index"][0] == "2018-01-01T00:00:00+00:00"
+
+
+def test_summarize_loads_uses_absolute_cooling():
+    times = pd.date_range("2018-01-01", periods=3, freq="h")
+    out = _summarize_loads(times, np.array([1.0, 3.0, 0.0]), np.array([0.0, -2.0, -4.0]))
+    assert out["heating"]["heating_total_kWh"] == 4.0
+    assert out["heating"]["heating_peak_kW"] == 3.0
+    assert out["cooling"]["cooling_total_kWh"] == 6.0
+    assert out["cooling"]["cooling_peak_kW"] == 4.0
+    assert out["cooling"]["start_time"] == "2018-01-01T00:00:00"
+    assert out["cooling"]["n_points"] == 3
+
+
+def test_summarize_loads_reports_positive_zero_without_cooling():
+    import math
+
+    times = pd.date_range("2018-01-01", periods=2, freq="h")
+    out = _summarize_loads(times, np.array([1.0, 0.0]), np.array([0.0, -0.0]))
+    assert math.copysign(1.0, out["cooling"]["cooling_total_kWh"]) == 1.0
+    assert math.copysign(1.0, out["cooling"]["cooling_peak_kW"]) == 1.0
+
+
+def test_orjson_provider_encodes_numpy_and_pandas():
+    from flask import Flask
+    from buem.apis.json_provider import OrjsonProvider
+
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    with app.app_context():
+        resp = app.json.response({"values": np.array([1.5, 2.0]), "peak": np.float64(2.0),
+                                  "start": pd.Timestamp("2018-01-01")})
+    assert resp.mimetype == "application/json"
+    assert app.json.loads(resp.get_data()) == {
+        "values": [1.5, 2.0], "peak": 2.0, "start": "2018-01-01T00:00:00",
+    }
+
+
+def test_orjson_provider_encodes_datetimes_like_isoformat():
+    from datetime import datetime, timezone
+    from flask import Flask
+    from buem.apis.json_provider import OrjsonProvider
+
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    naive = datetime(2018, 1, 1, 6)
+    aware = datetime(2018, 1, 1, 6, tzinfo=timezone.utc)
+    index = pd.date_range("2018-01-01", periods=2, freq="h", tz="Europe/Berlin")
+    with app.app_context():
+        doc = app.json.loads(app.json.response({
+            "naive": naive, "aware": aware, "ts": pd.Timestamp(naive),
+            "ts_aware": pd.Timestamp(aware), "index": index,
+        }).get_data())
+    assert doc["naive"] == doc["ts"] == naive.isoformat()
+    assert doc["aware"] == doc["ts_aware"] == aware.isoformat()
+    assert doc["index"] == [ts.isoformat() for ts in index]
+
+
+def test_fast_rotating_handler_rolls_over_only_past_max_bytes(tmp_path):
+    import logging
+    from buem.apis.log_handlers import FastRotatingFileHandler
+
+    handler = FastRotatingFileHandler(str(tmp_path / "api.log"), maxBytes=50, backupCount=1)
+    record = logging.LogRecord("buem", logging.INFO, __file__, 1, "x" * 20, None, None)
+    try:
+        assert not handler.shouldRollover(record)
+        handler.emit(record)
+        handler.emit(record)
+        assert handler.shouldRollover(record)
+    finally:
+        handler.close()
+
+
+def test_orjson_provider_parses_request_body():
+    from flask import Flask, request
+    from buem.apis.json_provider import OrjsonProvider
+
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    with app.test_request_context("/api/run", method="POST", data=b'{"A_ref": 100.5, "use_milp": false}'):
+        assert request.get_json(force=True) == {"A_ref": 100.5, "use_milp": False}
+
+
+def test_internal_error_returns_err_id_without_trace():
+    from flask import Flask
+
+    app = Flask(__name__)
+    with app.app_context():
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as exc:
+            resp, status = _internal_error(exc, "API run failed")
+    body = resp.get_json()
+    assert status == 500
+    assert body["error"] == "boom"
+    assert "trace" not in body
+    assert len(body["err_id"]) == 32
+
+
+def test_parse_bool_flag_prefers_query_and_rejects_false_strings():
+    from flask import Flask, request
+
+    app = Flask(__name__)
+    with app.test_request_context("/api/process?include_timeseries=Yes"):
+        assert _parse_bool_flag(request, {"include_timeseries": False}, "include_timeseries")
+    with app.test_request_context("/api/process"):
+        assert not _parse_bool_flag(request, {"include_timeseries": "false"}, "include_timeseries")
+        assert _parse_bool_flag(request, {"include_timeseries": True}, "include_timeseries")
+        assert _parse_bool_flag(request, {}, "include_timeseries", default=True)
+
+
+def test_timeseries_serialization_reuses_precomputed_index():
+    times = pd.date_range("2018-01-01", periods=2, freq="h")
+    idx = ["a", "b"]
+    assert _to_serializable_timeseries(times, np.array([1, 2]), idx)["index"] is idx
+
+
+def test_create_logging_handler_is_reused_per_path(tmp_path):
+    from buem.apis.log_handlers import create_logging_handler
+
+    path = tmp_path / "logs" / "api.log"
+    assert create_logging_handler(path) is create_logging_handler(path)
+    assert path.parent.is_dir()
+
+
+def test_gzip_if_accepted_compresses_large_bodies_only():
+    import gzip
+    from flask import Flask, jsonify
+
+    app = Flask(__name__)
+    doc = {"values": list(range(1000))}
+    with app.test_request_context("/api/process", headers={"Accept-Encoding": "gzip, deflate"}):
+        resp = _gzip_if_accepted(jsonify(doc))
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.vary
+        assert app.json.loads(gzip.decompress(resp.get_data())) == doc
+        assert "Content-Encoding" not in _gzip_if_accepted(jsonify({"ok": 1})).headers
+    with app.test_request_context("/api/process"):
+        assert "Content-Encoding" not in _gzip_if_accepted(jsonify(doc)).headers
@@ -5,19 +5,18 @@ to find the optimal configuration for the 22-core system.
 import json, time
 
 from pathlib import Path
+from buem.config import cfg_attribute
 from buem.integration.scripts.result_cache import clear_cache
-
-# Ensure feather cache exists by importing cfg_attribute first
-from buem.config import cfg_attribute  # noqa: F401
+from buem.parallelization.parallel_run import ParallelBuildingProcessor
 
 dummy_dir = Path(__file__).parent.parent / "src" / "buem" / "data" / "buildings" / "dummy"
 building_files = sorted(dummy_dir.glob("*.json"))
 
-# Import after ensuring weather cache
-from buem.parallelization.parallel_run import ParallelBuildingProcessor
-
 
 if __name__ == "__main__":
+    # Ensure feather cache exists before the workers start
+    cfg_attribute.load_weather()
+
     print(f"Found {len(building_files)} building files")
 
     worker_counts = [4, 6, 8, 10, 12]
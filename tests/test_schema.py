@@ -0,0 +1,59 @@
+"""Tests for the BUEM schema validator, schema version manager and integration exports."""
+import pytest
+
+
+def test_integration_package_resolves_exports_on_access():
+    """buem.integration exports resolve to the real classes on first access."""
+    import buem.integration as integration
+    from buem.integration.scripts.schema_validator import BuemSchemaValidator
+
+    assert integration.BuemSchemaValidator is BuemSchemaValidator
+    assert "BuemSchemaValidator" in vars(integration)
+    assert set(integration.__all__) <= set(dir(integration))
+    with pytest.raises(AttributeError):
+        integration.not_an_export
+
+
+def test_schema_validator_compiles_schema_once():
+    """The request schema is checked and compiled once per validator instance."""
+    from buem.integration.scripts.schema_validator import BuemSchemaValidator
+
+    validator = BuemSchemaValidator()
+    assert validator._compiled_validator("request") is validator._compiled_validator("request")
+    with pytest.raises(ValueError):
+        validator._compiled_validator("other")
+
+
+def test_schema_version_scan_is_shared_and_sees_new_versions(tmp_path):
+    """Managers share the version scan of a directory until a version dir is added."""
+    import os
+    from buem.integration.scripts.schema_manager import SchemaVersionManager
+
+    (tmp_path / "v2").mkdir()
+    (tmp_path / "v10").mkdir()
+    (tmp_path / "vx").mkdir()
+    assert SchemaVersionManager(tmp_path).get_available_versions() == ["v2", "v10"]
+
+    (tmp_path / "v3").mkdir()
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    manager = SchemaVersionManager(tmp_path)
+    assert manager.get_available_versions() == ["v2", "v3", "v10"]
+    assert manager.get_latest_version() == "v10"
+    assert SchemaVersionManager(tmp_path / "missing").get_available_versions() == []
+
+
+def test_legacy_validation_checks_schema_once_per_file_version(tmp_path):
+    """_validate_payload_legacy reuses the checked validator until the schema file changes."""
+    from buem.integration.scripts.schema_validator import _checked_schema_validator, _validate_payload_legacy
+
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["id"]}', encoding="utf-8")
+    mtime_ns = schema_path.stat().st_mtime_ns
+
+    kwargs = dict(label="request", schema_path=schema_path, instance_path=None)
+    assert _validate_payload_legacy(instance_data={"id": 1}, **kwargs) == 0
+    assert _validate_payload_legacy(instance_data={}, **kwargs) == 2
+    assert _checked_schema_validator(str(schema_path), mtime_ns) is _checked_schema_validator(str(schema_path), mtime_ns)
+    assert _validate_payload_legacy(instance_data={}, label="request",
+                                    schema_path=tmp_path / "missing.json", instance_path=None) == 2
@@ -2,15 +2,16 @@
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor
 
-# Ensure feather cache
-from buem.config import cfg_attribute  # noqa: F401
-
+from buem.config import cfg_attribute
 from buem.parallelization.parallel_run import process_single_building, _worker_init
 
 building = Path(__file__).resolve().parent.parent / "src" / "buem" / "data" / "buildings" / "dummy" / "building_01_small_residential.json"
 
 
 if __name__ == "__main__":
+    # Ensure feather cache
+    cfg_attribute.load_weather()
+
     # Test 1: Direct call (no pool)
     print("Test 1: Direct call...")
     result = process_single_building(building)